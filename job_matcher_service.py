@@ -2,20 +2,429 @@
 Job Matcher Service - Provides AI-powered job matching and resume tailoring
 """
 
+import hashlib
+import json
 import logging
 import streamlit as st
 from typing import Dict, List, Any, Optional, Union
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 from utils.ai_services.service_manager import AIServiceManager
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Set up logging; the application entry point configures handlers and levels
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns shared across calls. Patterns for case-insensitive
+# matches are written in lowercase and run against _ascii_lower() text, so
+# case folding happens once per text instead of inside the regex engine.
+_JOB_TITLE_RE = re.compile(r'(job title|position)[:]*\s*([^,\n\.]+)')
+_NAME_RE = re.compile(r'([A-Z][a-z]+ [A-Z][a-z]+)')
+_DEGREE_RE = re.compile(r'(bachelor|master|phd|mba|associate)')
+_SKILL_ITEM_RE = re.compile(r'(?:[\•\-]\s*|,\s*)([^,\n\•\-]+)')
+# One alternation over all responsibility headings; the capture group
+# index identifies which heading matched
+_RESPONSIBILITY_RE = re.compile(
+    '|'.join(
+        heading + r'[:\n]+(.+?)(?=\n\n|\n[a-z])'
+        for heading in (
+            r'responsibilities',
+            r'key duties',
+            r'job duties',
+            r'what you\'ll do'
+        )
+    ),
+    re.DOTALL
+)
+_BULLET_CHARS = ('•', '-', '*')
+_WORD_RE = re.compile(r'\b\w+\b')
+_FENCE_RE = re.compile(r'```.*?\n|```')
+
+# Maps every ASCII non-word character to a space for str.split tokenization
+_NON_WORD_TABLE = str.maketrans({
+    chr(code): ' ' for code in range(128)
+    if not (chr(code).isalnum() or chr(code) == '_')
+})
+
+# Lowercases ASCII letters only, so offsets into the result match the original
+_ASCII_LOWER_TABLE = str.maketrans(
+    'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'
+)
+
+# How far into a job description or personal information section to look
+# for the job title or applicant name before searching the whole text
+_JOB_TITLE_SEARCH_LIMIT = 1000
+_NAME_SEARCH_LIMIT = 300
+
+
+def _ascii_lower(text):
+    """Lowercase ASCII letters without changing the length of the text"""
+    return text.translate(_ASCII_LOWER_TABLE)
+
+
+def _tokenize(text):
+    """
+    Split text into lowercase words, matching ``\\b\\w+\\b`` tokenization
+    
+    ASCII text is split with str.translate and str.split, which avoids the
+    regex engine; other text falls back to the regex to keep Unicode word
+    semantics.
+    
+    Args:
+        text (str): Text to tokenize
+        
+    Returns:
+        list: Lowercase words
+    """
+    text = text.lower()
+    if text.isascii():
+        return text.translate(_NON_WORD_TABLE).split()
+    return _WORD_RE.findall(text)
+
+
+def _search_prefix(pattern, text, limit):
+    """
+    Search the start of a text first, falling back to the whole text
+    
+    Args:
+        pattern (re.Pattern): Compiled pattern to search for
+        text (str): Text to search
+        limit (int): Number of leading characters to search first
+        
+    Returns:
+        re.Match or None: The first match found
+    """
+    match = pattern.search(text, 0, limit)
+    if match is None or match.end() >= limit:
+        # Nothing in the prefix, or the match may continue past it
+        match = pattern.search(text)
+    return match
+
+
+def _extract_bullets(text):
+    """
+    Extract bullet point items from a block of text in a single line scan
+    
+    A bullet starts on a line beginning with one of the bullet characters and
+    continues over following lines until the next bullet or a blank line.
+    
+    Args:
+        text (str): Text containing bullet points
+        
+    Returns:
+        list: Bullet item texts, with continuation lines joined by spaces
+    """
+    bullets = []
+    current = []
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped[:1] in _BULLET_CHARS:
+            if current:
+                bullets.append(" ".join(current))
+            item = stripped[1:].strip()
+            current = [item] if item else []
+        elif not stripped:
+            # A blank line ends the current bullet
+            if current:
+                bullets.append(" ".join(current))
+            current = []
+        elif current:
+            current.append(stripped)
+    if current:
+        bullets.append(" ".join(current))
+    return bullets
+
+
+def _iter_keywords(text):
+    """Yield the words of a text that are long enough and not common words"""
+    return (
+        word for word in _tokenize(text)
+        if len(word) > 3 and word not in _COMMON_WORDS
+    )
+
+
+@st.cache_data(ttl=3600, show_spinner=False)  # Cache results for 1 hour
+def _jd_fingerprint(job_description):
+    """
+    Parse the parts of a job description shared by matching, tailoring and
+    cover letter generation, so each is computed once per job description
+    
+    Args:
+        job_description (str): Job description text
+        
+    Returns:
+        dict: Lowercased text, distinct keywords in first-occurrence order,
+              and the job title (None if not found)
+    """
+    lower = _ascii_lower(job_description)
+    job_title_match = _search_prefix(_JOB_TITLE_RE, lower, _JOB_TITLE_SEARCH_LIMIT)
+    return {
+        "lower": lower,
+        "keywords": tuple(dict.fromkeys(_iter_keywords(job_description))),
+        # Take the title from the original text to keep its capitalisation
+        "title": job_description[job_title_match.start(2):job_title_match.end(2)].strip()
+                 if job_title_match else None
+    }
+
+
+@lru_cache(maxsize=1024)
+def _keyword_re(keyword):
+    """Return a cached whole-word pattern for a keyword"""
+    return re.compile(r'\b' + re.escape(keyword) + r'\b')
+
+
+# Common words ignored when matching resume and job description keywords
+_COMMON_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'shall',
+    'should', 'can', 'could', 'may', 'might', 'must', 'of', 'from', 'as'
+})
+
+# Common categories and keywords for basic job description analysis
+_JD_CATEGORIES = {
+    "required_technical_skills": (
+        "python", "java", "javascript", "c++", "c#", "ruby", "php", "html", "css",
+        "react", "angular", "vue", "node.js", "django", "flask", "spring", "express",
+        "aws", "azure", "gcp", "cloud", "docker", "kubernetes", "devops", "ci/cd",
+        "machine learning", "ai", "artificial intelligence", "data science", "analytics",
+        "sql", "nosql", "database", "mongodb", "mysql", "postgresql", "oracle",
+        "excel", "tableau", "power bi", "git", "github", "jira", "confluence"
+    ),
+    "required_soft_skills": (
+        "leadership", "communication", "teamwork", "collaboration", "problem solving",
+        "critical thinking", "time management", "project management", "agile", "scrum",
+        "customer service", "interpersonal", "adaptability", "flexibility", "creativity"
+    ),
+    "education_requirements": (
+        "bachelor", "master", "phd", "doctorate", "mba", "degree", "university",
+        "college", "certification", "diploma", "graduate"
+    ),
+    "experience_requirements": (
+        "years of experience", "year experience", "junior", "senior", "lead",
+        "entry level", "mid level", "principal", "manager", "director"
+    )
+}
+
+
+_AC_AUTOMATON = None
+
+
+def _is_word_char(char):
+    """Return True if the character counts as a regex word character"""
+    return char.isalnum() or char == "_"
+
+
+def _is_word_boundary(text, index):
+    """Emulate the regex ``\\b`` assertion at ``index`` of ``text``"""
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+
+def _get_ac_automaton():
+    """Build the shared Aho-Corasick automaton over all category keywords once"""
+    global _AC_AUTOMATON
+    if _AC_AUTOMATON is None:
+        automaton = ahocorasick.Automaton()
+        for category, keywords in _JD_CATEGORIES.items():
+            for order, keyword in enumerate(keywords):
+                automaton.add_word(keyword, (category, order, keyword))
+        automaton.make_automaton()
+        _AC_AUTOMATON = automaton
+    return _AC_AUTOMATON
+
+
+def _find_keywords(text, keywords):
+    """
+    Find which keywords occur as whole words in a text, ignoring case
+    
+    Args:
+        text (str): Text to search
+        keywords (list): Keywords to look for
+        
+    Returns:
+        set: Lowercased keywords present in the text
+    """
+    text = text.lower()
+    # Only a handful of keywords are checked at a time, so a cheap substring
+    # test plus the cached whole-word pattern beats building an automaton
+    return {
+        keyword for keyword in {keyword.lower() for keyword in keywords}
+        if keyword in text and _keyword_re(keyword).search(text)
+    }
+
+
+def _scan_jd_keywords(text):
+    """
+    Find the category keywords present in a lowercased job description
+    
+    Walks the text once with an Aho-Corasick automaton when pyahocorasick is
+    installed, falling back to a substring prefilter plus a regex boundary
+    check per keyword otherwise.
+    
+    Args:
+        text (str): Lowercased job description text
+        
+    Returns:
+        list: (category, keyword) pairs in category keyword order
+    """
+    if not AHOCORASICK_AVAILABLE:
+        # Cheap substring test first; most descriptions contain only a few
+        # of the keywords, so the regex boundary check rarely runs
+        return [
+            (category, keyword)
+            for category, keywords in _JD_CATEGORIES.items()
+            for keyword in keywords
+            if keyword in text and _keyword_re(keyword).search(text)
+        ]
+        
+    found = set()
+    for end_index, (category, order, keyword) in _get_ac_automaton().iter(text):
+        start_index = end_index - len(keyword) + 1
+        # Keep the word-boundary semantics of the original regex search
+        if _is_word_boundary(text, start_index) and _is_word_boundary(text, end_index + 1):
+            found.add((category, order, keyword))
+            
+    # Preserve the declaration order of the keywords within each category
+    category_order = {category: index for index, category in enumerate(_JD_CATEGORIES)}
+    return [
+        (category, keyword)
+        for category, _, keyword in sorted(found, key=lambda item: (category_order[item[0]], item[1]))
+    ]
+
+
+_SERVICE_MANAGER = None
+
+# Marks a lazily loaded service slot that has not been resolved yet
+_UNRESOLVED = object()
+
+
+def _get_service_manager():
+    """Return the AI service manager shared by all JobMatcherService instances"""
+    global _SERVICE_MANAGER
+    if _SERVICE_MANAGER is None:
+        _SERVICE_MANAGER = AIServiceManager()
+    return _SERVICE_MANAGER
+
+
+def _content_key(resume_sections, job_description=""):
+    """
+    Build a stable cache key from resume content and a job description
+    
+    Args:
+        resume_sections (dict): Dictionary of resume sections
+        job_description (str): Job description text
+        
+    Returns:
+        str: Hex digest identifying the inputs
+    """
+    payload = json.dumps(resume_sections, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(
+        payload + b"\x00" + job_description.encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+
+def _context_executor(max_workers):
+    """
+    Create a thread pool whose workers share the current Streamlit script context
+    
+    Args:
+        max_workers (int): Maximum number of worker threads
+        
+    Returns:
+        ThreadPoolExecutor: Executor for I/O-bound AI service calls
+    """
+    return ThreadPoolExecutor(
+        max_workers=max_workers,
+        initializer=add_script_run_ctx,
+        initargs=(None, get_script_run_ctx())
+    )
+
+
+class _DegradedResult(Exception):
+    """Carries a fallback result out of a cached entry point so it is not cached"""
+    
+    def __init__(self, result):
+        super().__init__()
+        self.result = result
+
+
+def _cacheable(result, degraded):
+    """
+    Return a result from a cached entry point, keeping degraded ones uncached
+    
+    Args:
+        result: Result to return
+        degraded (bool): True if an AI service failed while producing it
+        
+    Returns:
+        The result, if it may be cached
+        
+    Raises:
+        _DegradedResult: If the result is degraded
+    """
+    if degraded:
+        raise _DegradedResult(result)
+    return result
+
+
+def _call_cached(cached_function, *args):
+    """
+    Call a cached entry point, passing degraded results through uncached
+    
+    Streamlit does not cache calls that raise, so a fallback produced after a
+    transient service failure is returned once and recomputed on the next call.
+    
+    Args:
+        cached_function: One of the _cached_* entry points
+        *args: Arguments for the entry point
+        
+    Returns:
+        tuple: (result, degraded)
+    """
+    try:
+        return cached_function(*args), False
+    except _DegradedResult as degraded:
+        return degraded.result, True
+
+
+# Cached entry points keyed on a content digest only; the underscore-prefixed
+# arguments are excluded from Streamlit's hashing. Call them through
+# _call_cached so degraded fallback results are never cached
+@st.cache_data(ttl=3600, show_spinner=False)  # Cache results for 1 hour
+def _cached_analyze_job_description(key, _service, _job_description):
+    return _service._analyze_job_description(_job_description)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)  # Cache results for 1 hour
+def _cached_match_resume_to_job(key, _service, _resume_sections, _job_description):
+    return _service._match_resume_to_job(_resume_sections, _job_description)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)  # Cache results for 1 hour
+def _cached_generate_tailored_resume(key, _service, _resume_sections, _job_description):
+    return _service._generate_tailored_resume(_resume_sections, _job_description)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)  # Cache results for 1 hour
+def _cached_generate_cover_letter(key, company_name, _service, _resume_sections, _job_description):
+    return _service._generate_cover_letter(_resume_sections, _job_description, company_name)
+
+
 class JobMatcherService:
     """Service for matching resumes to job descriptions and tailoring resumes"""
     
+    __slots__ = ("_gemini", "_huggingface", "_resume_analyzer")
+    
     def __init__(self, api_key=None):
         """
         Initialize the Job Matcher service
@@ -23,108 +432,122 @@ class JobMatcherService:
         Args:
             api_key (str, optional): Not used directly, but kept for API compatibility
         """
-        # Get the service manager
-        self.service_manager = AIServiceManager()
-        
-        # Try to get Gemini service
-        self.gemini = self.service_manager.get_service("gemini")
-        
-        # Try to get HuggingFace service
-        self.huggingface = self.service_manager.get_service("huggingface")
-        
-        # Try to get Resume Analyzer service
-        self.resume_analyzer = self.service_manager.get_service("resume_analyzer")
-        
-        # Set availability flags
-        self.gemini_available = self.gemini is not None
-        self.huggingface_available = self.huggingface is not None
-        self.resume_analyzer_available = self.resume_analyzer is not None
+        # AI services are resolved lazily on first use so that code paths
+        # which never touch them (e.g. basic matching) don't pay for loading them
+        self._gemini = _UNRESOLVED
+        self._huggingface = _UNRESOLVED
+        self._resume_analyzer = _UNRESOLVED
+        
+    def _resolve_service(self, slot, service_name):
+        """Load a service into its slot on first access and return it"""
+        service = getattr(self, slot)
+        if service is _UNRESOLVED:
+            service = self.service_manager.get_service(service_name)
+            setattr(self, slot, service)
+        return service
+        
+    @property
+    def service_manager(self):
+        """Shared AI service manager"""
+        return _get_service_manager()
+        
+    @property
+    def gemini(self):
+        """Gemini service, or None if unavailable"""
+        return self._resolve_service("_gemini", "gemini")
+        
+    @property
+    def huggingface(self):
+        """HuggingFace service, or None if unavailable"""
+        return self._resolve_service("_huggingface", "huggingface")
+        
+    @property
+    def resume_analyzer(self):
+        """Resume Analyzer service, or None if unavailable"""
+        return self._resolve_service("_resume_analyzer", "resume_analyzer")
+        
+    @property
+    def gemini_available(self):
+        """True if the Gemini service is available"""
+        return self.gemini is not None
+        
+    @property
+    def huggingface_available(self):
+        """True if the HuggingFace service is available"""
+        return self.huggingface is not None
+        
+    @property
+    def resume_analyzer_available(self):
+        """True if the Resume Analyzer service is available"""
+        return self.resume_analyzer is not None
         
     def analyze_job_description(self, job_description):
         """
         Analyze a job description to extract key information
         
+        Results are cached by the content of the job description, unless an AI
+        service failed while producing them.
+        
         Args:
             job_description (str): Job description text
             
         Returns:
             dict: Extracted information from the job description
         """
+        key = _content_key({}, job_description)
+        return _call_cached(_cached_analyze_job_description, key, self, job_description)[0]
+        
+    def _analyze_job_description(self, job_description):
+        """Uncached implementation of analyze_job_description"""
+        degraded = False
+        
         # If Gemini is available, use it for detailed analysis
         if self.gemini_available:
             try:
                 return self.gemini.extract_keywords_from_job(job_description)
             except Exception as e:
-                logger.error(f"Error analyzing job description with Gemini: {str(e)}")
+                logger.error("Error analyzing job description with Gemini: %s", e)
+                degraded = True
                 # Fall back to basic analysis
                 
         # Basic job description analysis
-        # Define common categories and keywords
-        categories = {
-            "required_technical_skills": [
-                "python", "java", "javascript", "c++", "c#", "ruby", "php", "html", "css",
-                "react", "angular", "vue", "node.js", "django", "flask", "spring", "express",
-                "aws", "azure", "gcp", "cloud", "docker", "kubernetes", "devops", "ci/cd",
-                "machine learning", "ai", "artificial intelligence", "data science", "analytics",
-                "sql", "nosql", "database", "mongodb", "mysql", "postgresql", "oracle",
-                "excel", "tableau", "power bi", "git", "github", "jira", "confluence"
-            ],
-            "required_soft_skills": [
-                "leadership", "communication", "teamwork", "collaboration", "problem solving",
-                "critical thinking", "time management", "project management", "agile", "scrum",
-                "customer service", "interpersonal", "adaptability", "flexibility", "creativity"
-            ],
-            "education_requirements": [
-                "bachelor", "master", "phd", "doctorate", "mba", "degree", "university",
-                "college", "certification", "diploma", "graduate"
-            ],
-            "experience_requirements": [
-                "years of experience", "year experience", "junior", "senior", "lead",
-                "entry level", "mid level", "principal", "manager", "director"
-            ]
-        }
-        
-        # Extract keywords by category
-        results = {}
-        for category, keywords in categories.items():
-            category_matches = []
-            for keyword in keywords:
-                # Look for matches, considering word boundaries
-                if re.search(r'\b' + re.escape(keyword) + r'\b', job_description.lower()):
-                    category_matches.append(keyword)
-            results[category] = category_matches
+        job_description_lower = _jd_fingerprint(job_description)["lower"]
+        results = {category: [] for category in _JD_CATEGORIES}
+        for category, keyword in _scan_jd_keywords(job_description_lower):
+            results[category].append(keyword)
             
         # Extract key responsibilities
         responsibilities = []
-        responsibility_patterns = [
-            r'Responsibilities[:\n]+(.+?)(?=\n\n|\n[A-Z])',
-            r'Key Duties[:\n]+(.+?)(?=\n\n|\n[A-Z])',
-            r'Job Duties[:\n]+(.+?)(?=\n\n|\n[A-Z])',
-            r'What You\'ll Do[:\n]+(.+?)(?=\n\n|\n[A-Z])'
-        ]
         
-        for pattern in responsibility_patterns:
-            matches = re.findall(pattern, job_description, re.DOTALL | re.IGNORECASE)
-            if matches:
-                # Process the matched text to extract bullet points
-                resp_text = matches[0]
-                # Look for bullet points
-                bullets = re.findall(r'[•\-*]\s*(.+?)(?=\n[•\-*]|\n\n|$)', resp_text, re.DOTALL)
-                if bullets:
-                    responsibilities.extend(bullets)
-                else:
-                    # If no bullets, split by newlines
-                    lines = [line.strip() for line in resp_text.split('\n') if line.strip()]
-                    responsibilities.extend(lines)
+        # Scan the description once, keeping the first match for each heading
+        first_matches = {}
+        for match in _RESPONSIBILITY_RE.finditer(job_description_lower):
+            group = match.lastindex
+            first_matches.setdefault(group, job_description[match.start(group):match.end(group)])
+            
+        for heading_index in sorted(first_matches):
+            # Process the matched text to extract bullet points
+            resp_text = first_matches[heading_index]
+            # Look for bullet points
+            bullets = _extract_bullets(resp_text)
+            if bullets:
+                responsibilities.extend(bullets)
+            else:
+                # If no bullets, split by newlines
+                lines = [line.strip() for line in resp_text.split('\n') if line.strip()]
+                responsibilities.extend(lines)
                 
         results["key_responsibilities"] = responsibilities
             
-        return results
+        return _cacheable(results, degraded)
         
     def match_resume_to_job(self, resume_sections, job_description):
         """
         Match a resume against a job description
         
+        Results are cached by the content of the resume and job description,
+        unless an AI service failed while producing them.
+        
         Args:
             resume_sections (dict): Dictionary of resume sections
             job_description (str): Job description text
@@ -132,23 +555,43 @@ class JobMatcherService:
         Returns:
             dict: Matching results and recommendations
         """
+        key = _content_key(resume_sections, job_description)
+        return _call_cached(
+            _cached_match_resume_to_job, key, self, resume_sections, job_description
+        )[0]
+        
+    def _match_resume_to_job(self, resume_sections, job_description):
+        """Uncached implementation of match_resume_to_job"""
+        degraded = False
+        
         # If Resume Analyzer is available, use it for matching
         if self.resume_analyzer_available:
             try:
                 return self.resume_analyzer.match_to_job(resume_sections, job_description)
             except Exception as e:
-                logger.error(f"Error matching with Resume Analyzer: {str(e)}")
+                logger.error("Error matching with Resume Analyzer: %s", e)
+                degraded = True
                 # Fall back to direct Gemini and HuggingFace
         
+        # Start HuggingFace matching in the background so it overlaps with Gemini;
+        # its result is used either to enhance or to replace the Gemini match
+        hf_future = None
+        if self.gemini_available and self.huggingface_available:
+            executor = _context_executor(max_workers=1)
+            hf_future = executor.submit(
+                self.huggingface.match_resume_to_job, resume_sections, job_description
+            )
+            executor.shutdown(wait=False)
+            
         # If Gemini is available, use it for comprehensive matching
         if self.gemini_available:
             try:
                 match_results = self.gemini.match_resume_to_job(resume_sections, job_description)
                 
                 # If HuggingFace is available, enhance with additional analysis
-                if self.huggingface_available:
+                if hf_future is not None:
                     try:
-                        hf_match = self.huggingface.match_resume_to_job(resume_sections, job_description)
+                        hf_match = hf_future.result()
                         
                         # Merge the results, preferring Gemini for overall structure
                         # but adding HuggingFace's detailed analysis
@@ -163,53 +606,55 @@ class JobMatcherService:
                             ))
                             
                     except Exception as e:
-                        logger.error(f"Error enhancing match with HuggingFace: {str(e)}")
+                        logger.error("Error enhancing match with HuggingFace: %s", e)
+                        degraded = True
                         
-                return match_results
-                
             except Exception as e:
-                logger.error(f"Error matching with Gemini: {str(e)}")
+                logger.error("Error matching with Gemini: %s", e)
+                degraded = True
                 # Fall back to HuggingFace
+            else:
+                return _cacheable(match_results, degraded)
                 
         # If Gemini failed or is not available, try HuggingFace
         if self.huggingface_available:
             try:
-                return self.huggingface.match_resume_to_job(resume_sections, job_description)
+                if hf_future is not None:
+                    hf_match = hf_future.result()
+                else:
+                    hf_match = self.huggingface.match_resume_to_job(resume_sections, job_description)
             except Exception as e:
-                logger.error(f"Error matching with HuggingFace: {str(e)}")
+                logger.error("Error matching with HuggingFace: %s", e)
+                degraded = True
                 # Fall back to basic matching
+            else:
+                return _cacheable(hf_match, degraded)
                 
         # Basic matching as a last resort
-        return self._basic_match(resume_sections, job_description)
+        return _cacheable(self._basic_match(resume_sections, job_description), degraded)
         
     def _basic_match(self, resume_sections, job_description):
         """Basic resume-job matching when AI services are unavailable"""
         # Create a single string with all resume content
-        resume_text = ""
-        for section_name, content in resume_sections.items():
-            if section_name not in ["full_text", "_match_results"] and content != "Missing":
-                resume_text += f"{content}\n\n"
+        resume_text = "\n\n".join(
+            f"{content}" for section_name, content in resume_sections.items()
+            if section_name not in ("full_text", "_match_results") and content != "Missing"
+        )
                 
-        # Extract words from resume and job description
-        resume_words = set(re.findall(r'\b\w+\b', resume_text.lower()))
-        job_words = set(re.findall(r'\b\w+\b', job_description.lower()))
-        
-        # Find matching and missing words
-        matching_words = resume_words.intersection(job_words)
-        missing_words = job_words - resume_words
-        
-        # Filter out common words
-        common_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-                        'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-                        'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'shall',
-                        'should', 'can', 'could', 'may', 'might', 'must', 'of', 'from', 'as'}
+        # Collect resume keywords; the job description keywords come from
+        # its cached fingerprint
+        resume_keywords = set(_iter_keywords(resume_text))
+        job_keywords = _jd_fingerprint(job_description)["keywords"]
         
-        matching_keywords = [word for word in matching_words if word not in common_words and len(word) > 3]
-        missing_keywords = [word for word in missing_words if word not in common_words and len(word) > 3]
+        # Partition job keywords into matching and missing in a single pass
+        matching_keywords = []
+        missing_keywords = []
+        for word in job_keywords:
+            (matching_keywords if word in resume_keywords else missing_keywords).append(word)
         
         # Calculate match percentage
-        if len(job_words - common_words) > 0:
-            match_percentage = int((len(matching_keywords) / len(job_words - common_words)) * 100)
+        if job_keywords:
+            match_percentage = int((len(matching_keywords) / len(job_keywords)) * 100)
         else:
             match_percentage = 0
             
@@ -243,6 +688,9 @@ class JobMatcherService:
         """
         Generate a fully tailored resume based on a job description
         
+        Results are cached by the content of the resume and job description,
+        unless an AI service failed while producing them.
+        
         Args:
             resume_sections (dict): Dictionary of resume sections
             job_description (str): Job description text
@@ -250,44 +698,75 @@ class JobMatcherService:
         Returns:
             dict: Dictionary of tailored resume sections
         """
+        key = _content_key(resume_sections, job_description)
+        return _call_cached(
+            _cached_generate_tailored_resume, key, self, resume_sections, job_description
+        )[0]
+        
+    def _generate_tailored_resume(self, resume_sections, job_description):
+        """Uncached implementation of generate_tailored_resume"""
+        degraded = False
+        
         # If Resume Analyzer is available, use it for tailoring
         if self.resume_analyzer_available:
             try:
                 return self.resume_analyzer.generate_tailored_resume(resume_sections, job_description)
             except Exception as e:
-                logger.error(f"Error tailoring with Resume Analyzer: {str(e)}")
+                logger.error("Error tailoring with Resume Analyzer: %s", e)
+                degraded = True
                 # Fall back to direct Gemini
                 
         # If Gemini is available, use it for comprehensive tailoring
         if self.gemini_available:
             try:
-                return self.gemini.generate_tailored_resume(resume_sections, job_description)
+                tailored_sections = self.gemini.generate_tailored_resume(resume_sections, job_description)
             except Exception as e:
-                logger.error(f"Error tailoring with Gemini: {str(e)}")
+                logger.error("Error tailoring with Gemini: %s", e)
+                degraded = True
                 # Fall back to section-by-section enhancement
+            else:
+                return _cacheable(tailored_sections, degraded)
                 
         # Enhance each section individually
         # First, get match results for reference
-        match_results = self.match_resume_to_job(resume_sections, job_description)
-        
-        # Then enhance each section
-        tailored_sections = {}
-        
-        for section_name, content in resume_sections.items():
+        match_results, match_degraded = _call_cached(
+            _cached_match_resume_to_job, _content_key(resume_sections, job_description),
+            self, resume_sections, job_description
+        )
+        degraded = degraded or match_degraded
+        
+        # Then enhance each section concurrently, since each enhancement
+        # is an independent AI service round trip
+        sections_to_enhance = [
+            section_name for section_name, content in resume_sections.items()
             # Skip full_text or missing sections
-            if section_name == "full_text" or content == "Missing":
-                tailored_sections[section_name] = content
-                continue
+            if section_name != "full_text" and content != "Missing"
+        ]
+        
+        enhanced = {}
+        if sections_to_enhance:
+            with _context_executor(max_workers=min(len(sections_to_enhance), 8)) as executor:
+                futures = {
+                    section_name: executor.submit(
+                        self._enhance_section, section_name, resume_sections[section_name],
+                        job_description, match_results
+                    )
+                    for section_name in sections_to_enhance
+                }
+                for section_name, future in futures.items():
+                    enhanced[section_name], section_degraded = future.result()
+                    degraded = degraded or section_degraded
                 
-            # Enhance the section
-            tailored_sections[section_name] = self._enhance_section(
-                section_name, content, job_description, match_results
-            )
+        # Keep the original section order
+        tailored_sections = {
+            section_name: enhanced.get(section_name, content)
+            for section_name, content in resume_sections.items()
+        }
             
         # Add match results for reference
         tailored_sections["_match_results"] = match_results
         
-        return tailored_sections
+        return _cacheable(tailored_sections, degraded)
         
     def _enhance_section(self, section_name, section_content, job_description, match_results):
         """
@@ -300,14 +779,17 @@ class JobMatcherService:
             match_results (dict): Results of resume-job matching
             
         Returns:
-            str: Enhanced section content
+            tuple: (enhanced section content, True if an AI service failed)
         """
+        degraded = False
+        
         # If Gemini is available, use it
         if self.gemini_available:
             try:
-                return self.gemini.enhance_resume_section(section_name, section_content, job_description)
+                return self.gemini.enhance_resume_section(section_name, section_content, job_description), False
             except Exception as e:
-                logger.error(f"Error enhancing {section_name} with Gemini: {str(e)}")
+                logger.error("Error enhancing %s with Gemini: %s", section_name, e)
+                degraded = True
                 
         # If HuggingFace is available, use it
         if self.huggingface_available:
@@ -319,47 +801,54 @@ class JobMatcherService:
                 if missing_keywords:
                     return self.huggingface.enhance_section_with_keywords(
                         section_content, missing_keywords
-                    )
+                    ), degraded
             except Exception as e:
-                logger.error(f"Error enhancing {section_name} with HuggingFace: {str(e)}")
+                logger.error("Error enhancing %s with HuggingFace: %s", section_name, e)
+                degraded = True
                 
         # Basic enhancement
         # If skill section and we have missing keywords, add them
         if section_name.lower() == "skills" and "missing_keywords" in match_results:
             missing_skills = match_results["missing_keywords"][:5]  # Top 5 missing skills
             
-            # Check if skills are already in section (case-insensitive)
+            # Check if skills are already in section (case-insensitive); each
+            # appended line is checked on its own rather than rescanning the
+            # whole section
             enhanced_content = section_content
+            present_skills = _find_keywords(section_content, missing_skills)
             for skill in missing_skills:
-                if not re.search(r'\b' + re.escape(skill) + r'\b', enhanced_content, re.IGNORECASE):
+                if skill.lower() not in present_skills:
                     # Add skill with a "Familiar with" prefix to indicate it's added
                     if "•" in enhanced_content:
                         # If bullet points are used, add another bullet
-                        enhanced_content += f"\n• Familiar with {skill}"
+                        addition = f"\n• Familiar with {skill}"
                     else:
                         # Otherwise, add with comma
-                        enhanced_content += f", Familiar with {skill}"
+                        addition = f", Familiar with {skill}"
+                    enhanced_content += addition
+                    present_skills |= _find_keywords(addition, missing_skills)
                         
-            return enhanced_content
+            return enhanced_content, degraded
             
         # For summary/objective, add job-specific language
         elif section_name.lower() in ["summary", "objective"]:
             # Extract job title if possible
-            job_title_match = re.search(r'(job title|position)[:]*\s*([^,\n\.]+)', job_description, re.IGNORECASE)
-            job_title = job_title_match.group(2).strip() if job_title_match else "the position"
+            job_title = _jd_fingerprint(job_description)["title"] or "the position"
             
             # Add job-specific statement if not already mentioned
             if job_title.lower() not in section_content.lower():
-                return section_content + f"\n\nSeeking to leverage my skills and experience as {job_title}."
+                return section_content + f"\n\nSeeking to leverage my skills and experience as {job_title}.", degraded
                 
         # For other sections, return as is
-        return section_content
+        return section_content, degraded
         
-    @st.cache_data(ttl=3600)  # Cache results for 1 hour
     def generate_cover_letter(self, resume_sections, job_description, company_name=None):
         """
         Generate a cover letter based on a resume and job description
         
+        Results are cached by the content of the resume and job description
+        and the company name, unless an AI service failed while producing them.
+        
         Args:
             resume_sections (dict): Dictionary of resume sections
             job_description (str): Job description text
@@ -368,18 +857,26 @@ class JobMatcherService:
         Returns:
             str: Generated cover letter
         """
+        key = _content_key(resume_sections, job_description)
+        return _call_cached(
+            _cached_generate_cover_letter, key, company_name, self, resume_sections, job_description
+        )[0]
+        
+    def _generate_cover_letter(self, resume_sections, job_description, company_name=None):
+        """Uncached implementation of generate_cover_letter"""
+        degraded = False
+        
         # Extract applicant name from personal information if available
         applicant_name = "Applicant"
         if "Personal Information" in resume_sections and resume_sections["Personal Information"] != "Missing":
-            name_match = re.search(r'([A-Z][a-z]+ [A-Z][a-z]+)', resume_sections["Personal Information"])
+            name_match = _search_prefix(
+                _NAME_RE, resume_sections["Personal Information"], _NAME_SEARCH_LIMIT
+            )
             if name_match:
                 applicant_name = name_match.group(1)
                 
         # Extract job title from job description
-        job_title = "the position"
-        job_title_match = re.search(r'(job title|position)[:]*\s*([^,\n\.]+)', job_description, re.IGNORECASE)
-        if job_title_match:
-            job_title = job_title_match.group(2).strip()
+        job_title = _jd_fingerprint(job_description)["title"] or "the position"
             
         # Use company name if provided
         company = company_name or "your company"
@@ -388,10 +885,11 @@ class JobMatcherService:
         if self.gemini_available:
             try:
                 # Create a condensed resume for the prompt
-                resume_info = ""
-                for section_name in ["Summary", "Skills", "Work Experience", "Education"]:
-                    if section_name in resume_sections and resume_sections[section_name] != "Missing":
-                        resume_info += f"{section_name}: {resume_sections[section_name]}\n\n"
+                resume_info = "".join(
+                    f"{section_name}: {resume_sections[section_name]}\n\n"
+                    for section_name in ("Summary", "Skills", "Work Experience", "Education")
+                    if section_name in resume_sections and resume_sections[section_name] != "Missing"
+                )
                         
                 prompt = f"""
                 Write a professional cover letter for {applicant_name} applying for the {job_title} position at {company}.
@@ -421,13 +919,11 @@ class JobMatcherService:
                 cover_letter = self.gemini.generate_text(prompt, temperature=0.5)
                 
                 # Clean up any markdown code blocks or unnecessary text
-                cover_letter = re.sub(r'```.*?\n', '', cover_letter)
-                cover_letter = re.sub(r'```', '', cover_letter)
-                
-                return cover_letter.strip()
+                return _FENCE_RE.sub('', cover_letter).strip()
                 
             except Exception as e:
-                logger.error(f"Error generating cover letter with Gemini: {str(e)}")
+                logger.error("Error generating cover letter with Gemini: %s", e)
+                degraded = True
                 # Fall back to template
                 
         # Template-based cover letter as fallback
@@ -446,7 +942,7 @@ class JobMatcherService:
         if "Skills" in resume_sections and resume_sections["Skills"] != "Missing":
             skills_text = resume_sections["Skills"]
             # Extract first few skills
-            skills = re.findall(r'(?:[\•\-]\s*|,\s*)([^,\n\•\-]+)', skills_text)[:3]
+            skills = _SKILL_ITEM_RE.findall(skills_text)[:3]
             if skills:
                 skills_str = ", ".join(skills)
                 cover_letter += f"My expertise in {skills_str}, along with my experience, makes me well-suited for this role. "
@@ -458,9 +954,9 @@ class JobMatcherService:
         # Add education if available
         if "Education" in resume_sections and resume_sections["Education"] != "Missing":
             education_text = resume_sections["Education"]
-            degree_match = re.search(r'(Bachelor|Master|PhD|MBA|Associate)', education_text, re.IGNORECASE)
+            degree_match = _DEGREE_RE.search(_ascii_lower(education_text))
             if degree_match:
-                degree = degree_match.group(1)
+                degree = education_text[degree_match.start(1):degree_match.end(1)]
                 cover_letter += f"With my {degree}'s degree and relevant training, I am prepared to contribute immediately. "
                 
         # Add closing
@@ -476,4 +972,4 @@ class JobMatcherService:
         
         cover_letter += applicant_name
         
-        return cover_letter.strip() 
\ No newline at end of file
+        return _cacheable(cover_letter.strip(), degraded) 
\ No newline at end of file
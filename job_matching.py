@@ -3,15 +3,187 @@ Job Matching Utilities - Functions for comparing resumes to job descriptions
 """
 
 import re
+import copy
 import logging
 import math
+import numpy as np
 from collections import Counter
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, List, Set, Tuple, Any, Optional
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Common words ignored during keyword extraction
+_STOPWORDS = frozenset({
+    'the', 'and', 'or', 'to', 'a', 'in', 'with', 'for', 'of', 'on', 'at', 'by', 
+    'is', 'are', 'be', 'will', 'an', 'as', 'this', 'that', 'from', 'you', 'your',
+    'we', 'our', 'their', 'they', 'it', 'have', 'has', 'had', 'not', 'but', 'if',
+    'about', 'who', 'what', 'when', 'where', 'why', 'how', 'all', 'can', 'should',
+    'would', 'other', 'which', 'such', 'them', 'these', 'some', 'than', 'its'
+})
+
+# Soft skills checked for in job descriptions and resumes
+_SOFT_SKILLS = frozenset({
+    'communication', 'leadership', 'teamwork', 'problem solving',
+    'time management', 'adaptability', 'creativity', 'critical thinking'
+})
+
+_WORD_RE = re.compile(r'\w+')
+_SKILLS_RE = re.compile(r'skill(?:s|set)?(?::|\.|\s)?\s*(.*?)(?:\.|;|$)')
+_SKILL_SPLIT_RE = re.compile(r',|\sand\s')
+_EXP_RE = re.compile(r'(\d+)(?:\+|\s*-\s*\d+)?\s*(?:year|yr)s?(?:\s+of)?\s+experience', re.IGNORECASE)
+_QUANT_RE = re.compile(r'\d+%|\d+\s*x|\$\s*\d+')
+_NON_SPACE_RE = re.compile(r'\S+')
+
+# Resume length thresholds (in words) for the length suggestions
+_SHORT_RESUME_WORDS = 200
+_LONG_RESUME_WORDS = 1000
+
+def _count_words(text: str, limit: int) -> int:
+    """
+    Count whitespace-separated words in text, stopping once limit is reached.
+    
+    Args:
+        text: Text to count words in
+        limit: Maximum count to return
+        
+    Returns:
+        Number of words, capped at limit
+    """
+    return sum(1 for _ in islice(_NON_SPACE_RE.finditer(text), limit))
+
+def _tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase word tokens in a single regex pass.
+    
+    Args:
+        text: The text to tokenize
+        
+    Returns:
+        List of lowercase words, with punctuation acting as a separator
+    """
+    return _WORD_RE.findall(text.lower())
+
+def _is_word_char(char: str) -> bool:
+    """Return True if the character counts as a regex word character"""
+    return char.isalnum() or char == '_'
+
+def _contains_term(text: str, term: str) -> bool:
+    """
+    Check whether a literal term occurs in text with no word character
+    directly before or after it.
+    
+    Args:
+        text: The text to search
+        term: The literal term to look for
+        
+    Returns:
+        True if the term occurs as a standalone term
+    """
+    start = text.find(term)
+    while start != -1:
+        end = start + len(term)
+        if ((start == 0 or not _is_word_char(text[start - 1])) and
+                (end == len(text) or not _is_word_char(text[end]))):
+            return True
+        start = text.find(term, start + 1)
+    return False
+
+def _count_found_skills(skills: List[str], text: str) -> int:
+    """
+    Count how many skills appear in text as whole words.
+    
+    Plain skills and text are normalized to space-padded lowercase tokens, so
+    a skill matches only on word boundaries and multi-word skills must be
+    adjacent. Skills containing punctuation (e.g. "c++", "c#", ".net") would
+    lose it in tokenization, so they are matched literally instead.
+    
+    Args:
+        skills: Skills to look for
+        text: The text to search
+        
+    Returns:
+        Number of distinct skills found
+    """
+    needles = {}
+    terms = {}
+    for index, skill in enumerate(skills):
+        skill_words = _tokenize(skill)
+        term = ' '.join(skill.lower().split())
+        if not skill_words:
+            continue
+        if ' '.join(skill_words) == term:
+            needles.setdefault(f" {term} ", []).append(index)
+        else:
+            terms.setdefault(term, []).append(index)
+    
+    found_count = 0
+    if terms:
+        text_lower = ' '.join(text.lower().split())
+        found_count = sum(
+            len(indexes) for term, indexes in terms.items()
+            if _contains_term(text_lower, term)
+        )
+    
+    if not needles:
+        return found_count
+    
+    # Only a handful of skills are checked at a time, so a substring test
+    # per padded needle beats building an automaton
+    haystack = f" {' '.join(_tokenize(text))} "
+    return found_count + sum(
+        len(indexes) for needle, indexes in needles.items() if needle in haystack
+    )
+
+def _extract_keywords(text: str, max_keywords: int) -> Dict[str, int]:
+    """
+    Extract the most frequent keywords and two-word phrases from text.
+    
+    Args:
+        text: The text to analyze
+        max_keywords: Maximum number of keywords to extract
+        
+    Returns:
+        Dictionary of keywords and their frequency
+    """
+    # Normalize and split into words
+    words = _tokenize(text)
+    
+    # Flag common words and short words for removal
+    valid = [word not in _STOPWORDS and len(word) > 2 for word in words]
+    
+    # Count word frequency, streaming the valid words into the counter
+    word_counts = Counter(word for word, keep in zip(words, valid) if keep)
+    
+    # Count key phrases from adjacent pairs of valid words
+    phrase_counts = Counter(
+        f"{first} {second}"
+        for first, second, keep_first, keep_second in zip(words, words[1:], valid, valid[1:])
+        if keep_first and keep_second
+    )
+    
+    # Combine single words and phrases, prioritizing phrases
+    combined_counts = {}
+    
+    # Add top phrases first, indexing the words they contain
+    phrase_words = set()
+    for phrase, count in phrase_counts.most_common(max_keywords // 2):
+        combined_counts[phrase] = count * 2  # Give phrases higher weight
+        phrase_words.update(phrase.split())
+    
+    # Add top words next, skipping words already covered by a phrase
+    for word, count in word_counts.most_common(max_keywords):
+        if len(combined_counts) >= max_keywords:
+            break
+        if word not in phrase_words:
+            combined_counts[word] = count
+    
+    # Return top keywords
+    return dict(Counter(combined_counts).most_common(max_keywords))
+
 def extract_job_keywords(job_description: str, max_keywords: int = 30) -> Dict[str, int]:
     """
     Extract important keywords from a job description.
@@ -24,54 +196,7 @@ def extract_job_keywords(job_description: str, max_keywords: int = 30) -> Dict[s
         Dictionary of keywords and their frequency
     """
     try:
-        # Clean and normalize text
-        text = job_description.lower()
-        text = re.sub(r'[^\w\s]', ' ', text)  # Replace punctuation with spaces
-        
-        # Split into words
-        words = text.split()
-        
-        # Remove common words and short words
-        common_words = {
-            'the', 'and', 'or', 'to', 'a', 'in', 'with', 'for', 'of', 'on', 'at', 'by', 
-            'is', 'are', 'be', 'will', 'an', 'as', 'this', 'that', 'from', 'you', 'your',
-            'we', 'our', 'their', 'they', 'it', 'have', 'has', 'had', 'not', 'but', 'if',
-            'about', 'who', 'what', 'when', 'where', 'why', 'how', 'all', 'can', 'should',
-            'would', 'other', 'which', 'such', 'them', 'these', 'some', 'than', 'its'
-        }
-        
-        filtered_words = [word for word in words if word not in common_words and len(word) > 2]
-        
-        # Count word frequency
-        word_counts = Counter(filtered_words)
-        
-        # Extract key phrases (basic implementation)
-        phrases = []
-        for i in range(len(words) - 1):
-            if (words[i] not in common_words and len(words[i]) > 2 and 
-                words[i+1] not in common_words and len(words[i+1]) > 2):
-                phrases.append(f"{words[i]} {words[i+1]}")
-        
-        # Count phrase frequency
-        phrase_counts = Counter(phrases)
-        
-        # Combine single words and phrases, prioritizing phrases
-        combined_counts = {}
-        
-        # Add top phrases first
-        for phrase, count in phrase_counts.most_common(max_keywords // 2):
-            combined_counts[phrase] = count * 2  # Give phrases higher weight
-        
-        # Add top words next
-        for word, count in word_counts.most_common(max_keywords):
-            if len(combined_counts) >= max_keywords:
-                break
-            if not any(word in phrase for phrase in combined_counts.keys()):
-                combined_counts[word] = count
-        
-        # Return top keywords
-        return dict(Counter(combined_counts).most_common(max_keywords))
-        
+        return _extract_keywords(job_description, max_keywords)
     except Exception as e:
         logger.error(f"Error extracting job keywords: {str(e)}")
         return {}
@@ -88,54 +213,7 @@ def extract_resume_keywords(resume_text: str, max_keywords: int = 50) -> Dict[st
         Dictionary of keywords and their frequency
     """
     try:
-        # Clean and normalize text
-        text = resume_text.lower()
-        text = re.sub(r'[^\w\s]', ' ', text)  # Replace punctuation with spaces
-        
-        # Split into words
-        words = text.split()
-        
-        # Remove common words and short words
-        common_words = {
-            'the', 'and', 'or', 'to', 'a', 'in', 'with', 'for', 'of', 'on', 'at', 'by', 
-            'is', 'are', 'be', 'will', 'an', 'as', 'this', 'that', 'from', 'you', 'your',
-            'we', 'our', 'their', 'they', 'it', 'have', 'has', 'had', 'not', 'but', 'if',
-            'about', 'who', 'what', 'when', 'where', 'why', 'how', 'all', 'can', 'should',
-            'would', 'other', 'which', 'such', 'them', 'these', 'some', 'than', 'its'
-        }
-        
-        filtered_words = [word for word in words if word not in common_words and len(word) > 2]
-        
-        # Count word frequency
-        word_counts = Counter(filtered_words)
-        
-        # Extract key phrases (basic implementation)
-        phrases = []
-        for i in range(len(words) - 1):
-            if (words[i] not in common_words and len(words[i]) > 2 and 
-                words[i+1] not in common_words and len(words[i+1]) > 2):
-                phrases.append(f"{words[i]} {words[i+1]}")
-        
-        # Count phrase frequency
-        phrase_counts = Counter(phrases)
-        
-        # Combine single words and phrases
-        combined_counts = {}
-        
-        # Add top phrases first
-        for phrase, count in phrase_counts.most_common(max_keywords // 2):
-            combined_counts[phrase] = count * 2  # Give phrases higher weight
-        
-        # Add top words next
-        for word, count in word_counts.most_common(max_keywords):
-            if len(combined_counts) >= max_keywords:
-                break
-            if not any(word in phrase for phrase in combined_counts.keys()):
-                combined_counts[word] = count
-        
-        # Return top keywords
-        return dict(Counter(combined_counts).most_common(max_keywords))
-        
+        return _extract_keywords(resume_text, max_keywords)
     except Exception as e:
         logger.error(f"Error extracting resume keywords: {str(e)}")
         return {}
@@ -144,6 +222,9 @@ def compare_resume_to_job(resume_text: str, job_description: str) -> Dict[str, A
     """
     Compare a resume against a job description and return matching analysis.
     
+    Results are cached per resume/job pair, since the helpers below all start
+    from the same comparison.
+    
     Args:
         resume_text: The resume text
         job_description: The job description text
@@ -151,22 +232,24 @@ def compare_resume_to_job(resume_text: str, job_description: str) -> Dict[str, A
     Returns:
         Dictionary with matching analysis results
     """
+    # Return a copy so callers can't mutate the cached value
+    return copy.deepcopy(_compare_resume_to_job_cached(resume_text, job_description))
+
+@lru_cache(maxsize=128)
+def _compare_resume_to_job_cached(resume_text: str, job_description: str) -> Dict[str, Any]:
+    """Cached implementation of compare_resume_to_job."""
     try:
         # Extract keywords from both
         job_keywords = extract_job_keywords(job_description)
         resume_keywords = extract_resume_keywords(resume_text)
         
-        # Find matching keywords
+        # Partition job keywords into matching and missing in a single pass,
+        # keeping the job description's frequency order so the "top missing"
+        # suggestions still come first
         matching_keywords = []
-        for keyword in job_keywords:
-            if keyword in resume_keywords:
-                matching_keywords.append(keyword)
-        
-        # Find missing keywords
         missing_keywords = []
         for keyword in job_keywords:
-            if keyword not in resume_keywords:
-                missing_keywords.append(keyword)
+            (matching_keywords if keyword in resume_keywords else missing_keywords).append(keyword)
         
         # Calculate match percentage
         if job_keywords:
@@ -175,19 +258,17 @@ def compare_resume_to_job(resume_text: str, job_description: str) -> Dict[str, A
             match_percentage = 0
         
         # Look for skill mentions
-        skills_pattern = r'skill(?:s|set)?(?::|\.|\s)?\s*(.*?)(?:\.|;|$)'
-        skills_match = re.search(skills_pattern, job_description.lower())
+        skills_match = _SKILLS_RE.search(job_description.lower())
         required_skills = []
         
         if skills_match:
             skills_text = skills_match.group(1)
             # Extract skills from the skills section
-            skills_list = re.split(r',|\sand\s', skills_text)
+            skills_list = _SKILL_SPLIT_RE.split(skills_text)
             required_skills = [skill.strip() for skill in skills_list if skill.strip()]
         
         # Look for experience mentions
-        experience_pattern = r'(\d+)(?:\+|\s*-\s*\d+)?\s*(?:year|yr)s?(?:\s+of)?\s+experience'
-        experience_matches = re.findall(experience_pattern, job_description.lower())
+        experience_matches = _EXP_RE.findall(job_description)
         required_years = 0
         
         if experience_matches:
@@ -195,6 +276,9 @@ def compare_resume_to_job(resume_text: str, job_description: str) -> Dict[str, A
             years = [int(year) for year in experience_matches]
             required_years = max(years) if years else 0
         
+        # Look for experience claimed in the resume
+        max_resume_years = max(map(int, _EXP_RE.findall(resume_text)), default=0)
+        
         # Return results
         return {
             'job_keywords': job_keywords,
@@ -203,7 +287,8 @@ def compare_resume_to_job(resume_text: str, job_description: str) -> Dict[str, A
             'missing_keywords': missing_keywords,
             'match_percentage': match_percentage,
             'required_skills': required_skills,
-            'required_years': required_years
+            'required_years': required_years,
+            'max_resume_years': max_resume_years
         }
         
     except Exception as e:
@@ -215,7 +300,8 @@ def compare_resume_to_job(resume_text: str, job_description: str) -> Dict[str, A
             'missing_keywords': [],
             'match_percentage': 0,
             'required_skills': [],
-            'required_years': 0
+            'required_years': 0,
+            'max_resume_years': 0
         }
 
 def calculate_match_percentage(resume_text: str, job_description: str) -> float:
@@ -229,16 +315,52 @@ def calculate_match_percentage(resume_text: str, job_description: str) -> float:
     Returns:
         Match percentage (0-100)
     """
+    # A batch of one; errors are logged and scored 0 by the batch
+    return calculate_match_percentages([resume_text], job_description)[0]
+
+def calculate_match_percentages(resume_texts: List[str], job_description: str) -> List[float]:
+    """
+    Calculate the percentage match of several resumes against one job description.
+    
+    The job description keywords are extracted once, and keyword membership
+    for every resume is checked in a single vectorized pass over the keyword
+    strings.
+    
+    Args:
+        resume_texts: The resume texts
+        job_description: The job description text
+        
+    Returns:
+        Match percentages (0-100), in the same order as resume_texts
+    """
     try:
-        # Get comparison results
-        results = compare_resume_to_job(resume_text, job_description)
+        job_keywords = extract_job_keywords(job_description)
+        if not job_keywords or not resume_texts:
+            return [0] * len(resume_texts)
+        
+        job_terms = np.array(list(job_keywords), dtype=str)
+        
+        # Flatten every resume's keywords, remembering which resume each came
+        # from, so matches can be counted per resume with one bincount
+        resume_terms = []
+        resume_ids = []
+        for index, resume_text in enumerate(resume_texts):
+            resume_keywords = extract_resume_keywords(resume_text)
+            resume_terms.extend(resume_keywords)
+            resume_ids.extend([index] * len(resume_keywords))
         
-        # Return the match percentage
-        return results.get('match_percentage', 0)
+        # Compare the keyword strings themselves; each resume's keywords are
+        # unique, so every hit is a distinct matching job keyword
+        resume_terms = np.array(resume_terms, dtype=str)
+        resume_ids = np.array(resume_ids, dtype=np.intp)
+        matched = np.isin(resume_terms, job_terms)
+        match_counts = np.bincount(resume_ids[matched], minlength=len(resume_texts))
+        
+        return (match_counts / len(job_terms) * 100).tolist()
         
     except Exception as e:
-        logger.error(f"Error calculating match percentage: {str(e)}")
-        return 0
+        logger.error(f"Error calculating match percentages: {str(e)}")
+        return [0] * len(resume_texts)
 
 def get_missing_skills(resume_text: str, job_description: str) -> List[str]:
     """
@@ -277,6 +399,10 @@ def generate_improvement_suggestions(resume_text: str, job_description: str) ->
         # Get comparison results
         results = compare_resume_to_job(resume_text, job_description)
         
+        # Lowercase both texts once for the case-insensitive checks below
+        resume_text_lower = resume_text.lower()
+        job_description_lower = job_description.lower()
+        
         suggestions = []
         
         # Add missing keywords suggestion
@@ -288,30 +414,24 @@ def generate_improvement_suggestions(resume_text: str, job_description: str) ->
         # Check for required years of experience
         required_years = results.get('required_years', 0)
         if required_years > 0:
-            exp_pattern = r'(\d+)(?:\+|\s*-\s*\d+)?\s*(?:year|yr)s?(?:\s+of)?\s+experience'
-            resume_exp_matches = re.findall(exp_pattern, resume_text.lower())
-            resume_years = [int(year) for year in resume_exp_matches]
-            max_resume_years = max(resume_years) if resume_years else 0
-            
-            if max_resume_years < required_years:
+            if results.get('max_resume_years', 0) < required_years:
                 suggestions.append(f"Highlight your {required_years}+ years of experience if you have it")
         
         # Check for quantifiable achievements
-        if not re.search(r'\d+%|\d+\s*x|\$\s*\d+', resume_text):
+        if not _QUANT_RE.search(resume_text):
             suggestions.append("Add quantifiable achievements (e.g., 'increased sales by 20%')")
         
         # Check if resume length seems appropriate
-        words_in_resume = len(resume_text.split())
-        if words_in_resume < 200:
+        # Only need to know whether the count passes the long threshold
+        words_in_resume = _count_words(resume_text, _LONG_RESUME_WORDS + 1)
+        if words_in_resume < _SHORT_RESUME_WORDS:
             suggestions.append("Your resume seems short. Consider adding more details about your experience")
-        elif words_in_resume > 1000:
+        elif words_in_resume > _LONG_RESUME_WORDS:
             suggestions.append("Your resume is quite long. Consider focusing on the most relevant experience")
         
         # Check for soft skills
-        soft_skills = ['communication', 'leadership', 'teamwork', 'problem solving', 
-                      'time management', 'adaptability', 'creativity', 'critical thinking']
-        if any(skill in job_description.lower() for skill in soft_skills):
-            if not any(skill in resume_text.lower() for skill in soft_skills):
+        if any(skill in job_description_lower for skill in _SOFT_SKILLS):
+            if not any(skill in resume_text_lower for skill in _SOFT_SKILLS):
                 suggestions.append("Include relevant soft skills mentioned in the job description")
         
         # Additional suggestions
@@ -344,21 +464,15 @@ def get_matching_score_details(resume_text: str, job_description: str) -> Dict[s
         keyword_match = results.get('match_percentage', 0)
         
         # Skills match (percentage of required skills found in resume)
+        # Match all required skills against the resume in one scan
         required_skills = results.get('required_skills', [])
-        skills_found = 0
-        
-        for skill in required_skills:
-            if skill.lower() in resume_text.lower():
-                skills_found += 1
+        skills_found = _count_found_skills(required_skills, resume_text)
         
         skills_match = (skills_found / len(required_skills) * 100) if required_skills else 0
         
         # Experience match
         required_years = results.get('required_years', 0)
-        exp_pattern = r'(\d+)(?:\+|\s*-\s*\d+)?\s*(?:year|yr)s?(?:\s+of)?\s+experience'
-        resume_exp_matches = re.findall(exp_pattern, resume_text.lower())
-        resume_years = [int(year) for year in resume_exp_matches]
-        max_resume_years = max(resume_years) if resume_years else 0
+        max_resume_years = results.get('max_resume_years', 0)
         
         if required_years == 0:
             experience_match = 100  # No specific requirement
@@ -1,8 +1,56 @@
+import re
+import bisect
+import copy
+import hashlib
+import threading
 import requests
 import json
+from collections import OrderedDict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from utils.api_config import API_CONFIG
 
+# Phrases flagged as passive voice by the mock checker (simplified)
+_PASSIVE_PATTERNS = ("is being", "was being", "were being", "are being", 
+                     "has been", "have been", "had been",
+                     "will be", "will have been")
+
+# Weak words flagged by the mock checker (simplified)
+_WEAK_WORDS = (
+    {"word": "very", "replacement": "extremely", "message": "Consider a stronger alternative to 'very'"},
+    {"word": "really", "replacement": "genuinely", "message": "Consider a stronger alternative to 'really'"},
+    {"word": "good", "replacement": "excellent", "message": "Consider a more specific or stronger alternative to 'good'"},
+    {"word": "nice", "replacement": "outstanding", "message": "Consider a more impactful alternative to 'nice'"},
+    {"word": "great", "replacement": "exceptional", "message": "Consider a more specific alternative to 'great'"},
+    {"word": "a lot", "replacement": "significantly", "message": "Consider a more precise alternative to 'a lot'"}
+)
+
+_WEAK_WORDS_BY_WORD = {weak["word"]: weak for weak in _WEAK_WORDS}
+
+# Matches every whole-word occurrence of every mock pattern in one scan; the
+# lookahead lets overlapping occurrences (e.g. "have been" inside
+# "will have been") all be reported
+_MOCK_PATTERN_RE = re.compile(
+    r"(?=\b(" + "|".join(re.escape(pattern) for pattern in
+                        _PASSIVE_PATTERNS + tuple(_WEAK_WORDS_BY_WORD)) + r")\b)",
+    re.IGNORECASE
+)
+
+# Characters that end a sentence when extracting issue context
+_SENTENCE_END_RE = re.compile(r"[.!?\n]")
+
+# (connect, read) timeout in seconds for LanguageTool API requests
+_REQUEST_TIMEOUT = (2, 10)
+
+# Maximum number of LanguageTool requests in flight for a batch check
+_MAX_CONCURRENT_CHECKS = 8
+
+# Maximum number of checked texts whose issues are kept in memory
+_CHECK_CACHE_SIZE = 256
+
 class LanguageToolClient:
     def __init__(self):
         self.config = API_CONFIG["language_tool"]
@@ -10,6 +58,51 @@ class LanguageToolClient:
         self.api_key = self.config["api_key"]
         self.initialized = self.api_key is not None and self.host is not None
         
+        # Reuse keep-alive connections across checks instead of opening a new
+        # TCP/TLS connection per request; checks are idempotent, so POSTs are
+        # safe to retry on transient errors
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(["GET", "POST"]),
+                raise_on_status=False
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # LRU cache of issues keyed by (text digest, language), so re-renders
+        # of unchanged text skip both the API call and the mock scan
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+    def _cache_key(self, text, language):
+        """Return the issue cache key for a text and language"""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(), language
+    
+    def _cache_get(self, key):
+        """Return a copy of the cached issues for key, or None on a miss"""
+        with self._cache_lock:
+            issues = self._cache.get(key)
+            if issues is None:
+                return None
+            self._cache.move_to_end(key)
+        # Callers may modify the issues they get back
+        return copy.deepcopy(issues)
+    
+    def _cache_put(self, key, issues):
+        """Store issues for key, evicting the least recently used entry"""
+        with self._cache_lock:
+            self._cache[key] = copy.deepcopy(issues)
+            self._cache.move_to_end(key)
+            if len(self._cache) > _CHECK_CACHE_SIZE:
+                self._cache.popitem(last=False)
+    
     def check_text(self, text, language="en-US"):
         """
         Check text for grammar and style issues
@@ -21,8 +114,15 @@ class LanguageToolClient:
         Returns:
             list: List of issues found
         """
+        key = self._cache_key(text, language)
+        issues = self._cache_get(key)
+        if issues is not None:
+            return issues
+        
         if not self.initialized:
-            return self._get_mock_issues(text)
+            issues = self._get_mock_issues(text)
+            self._cache_put(key, issues)
+            return issues
             
         try:
             # API endpoint
@@ -42,10 +142,12 @@ class LanguageToolClient:
                 headers["Authorization"] = f"Bearer {self.api_key}"
             
             # Make API request
-            response = requests.post(endpoint, data=params, headers=headers)
+            response = self.session.post(endpoint, data=params, headers=headers,
+                                         timeout=_REQUEST_TIMEOUT)
             
             if response.status_code == 200:
                 issues = response.json().get("matches", [])
+                self._cache_put(key, issues)
                 return issues
             
             # Fall back to mock issues if API fails
@@ -56,6 +158,33 @@ class LanguageToolClient:
             st.warning(f"LanguageTool API error: {str(e)}")
             return self._get_mock_issues(text)
     
+    def check_texts(self, texts, language="en-US"):
+        """
+        Check several texts (e.g. resume sections) for grammar and style issues
+        
+        Requests are sent concurrently over the pooled session, so the total
+        latency is close to that of the slowest check rather than the sum.
+        
+        Args:
+            texts: Texts to check
+            language: Language code (e.g., en-US, de-DE)
+            
+        Returns:
+            list: List of issue lists, in the same order as texts
+        """
+        texts = list(texts)
+        
+        # Mock checks are CPU-bound and gain nothing from threads
+        if not self.initialized or len(texts) < 2:
+            return [self.check_text(text, language) for text in texts]
+        
+        with ThreadPoolExecutor(
+            max_workers=min(len(texts), _MAX_CONCURRENT_CHECKS),
+            initializer=add_script_run_ctx,
+            initargs=(None, get_script_run_ctx())
+        ) as executor:
+            return list(executor.map(lambda text: self.check_text(text, language), texts))
+    
     def _get_mock_issues(self, text):
         """
         Generate mock grammar issues when API is unavailable
@@ -66,84 +195,84 @@ class LanguageToolClient:
         Returns:
             list: Mock list of issues
         """
-        # Simple pattern matching for common issues
-        issues = []
-        
-        # Check for passive voice (simplified)
-        passive_patterns = ["is being", "was being", "were being", "are being", 
-                          "has been", "have been", "had been",
-                          "will be", "will have been"]
-                          
-        for pattern in passive_patterns:
-            if pattern in text.lower():
-                start_index = text.lower().find(pattern)
-                end_index = start_index + len(pattern)
-                
-                # Find the full containing sentence (simplified)
-                sentence_start = max(0, text.rfind(".", 0, start_index) + 1)
-                sentence_end = text.find(".", end_index)
-                if sentence_end == -1:
-                    sentence_end = len(text)
-                
-                context = text[sentence_start:sentence_end].strip()
-                
-                issues.append({
-                    "message": "Consider using active voice instead of passive voice",
-                    "replacements": [{"value": "actively did"}],  # Simplified suggestion
-                    "offset": start_index,
-                    "length": len(pattern),
-                    "context": {
-                        "text": context,
-                        "offset": start_index - sentence_start
-                    },
-                    "rule": {
+        # Simple pattern matching for common issues, scanning the text once
+        # for every occurrence of every pattern
+        passive_issues = []
+        weak_issues = []
+        
+        # Sentence end offsets, with sentinels for the start and end of the text
+        boundaries = [-1]
+        boundaries.extend(match.start() for match in _SENTENCE_END_RE.finditer(text))
+        boundaries.append(len(text))
+        
+        for match in _MOCK_PATTERN_RE.finditer(text):
+            start_index, end_index = match.span(1)
+            weak = _WEAK_WORDS_BY_WORD.get(match.group(1).lower())
+            
+            if weak is None:
+                # Passive voice (simplified)
+                passive_issues.append(self._build_mock_issue(
+                    text, boundaries, start_index, end_index - start_index,
+                    message="Consider using active voice instead of passive voice",
+                    replacement="actively did",  # Simplified suggestion
+                    rule={
                         "id": "PASSIVE_VOICE",
                         "description": "Use of passive voice",
                         "issueType": "style"
                     }
-                })
-        
-        # Check for weak words (simplified)
-        weak_words = [
-            {"word": "very", "replacement": "extremely", "message": "Consider a stronger alternative to 'very'"},
-            {"word": "really", "replacement": "genuinely", "message": "Consider a stronger alternative to 'really'"},
-            {"word": "good", "replacement": "excellent", "message": "Consider a more specific or stronger alternative to 'good'"},
-            {"word": "nice", "replacement": "outstanding", "message": "Consider a more impactful alternative to 'nice'"},
-            {"word": "great", "replacement": "exceptional", "message": "Consider a more specific alternative to 'great'"},
-            {"word": "a lot", "replacement": "significantly", "message": "Consider a more precise alternative to 'a lot'"}
-        ]
-        
-        for weak in weak_words:
-            word = weak["word"]
-            if word in text.lower():
-                start_index = text.lower().find(word)
-                end_index = start_index + len(word)
-                
-                # Find the full containing sentence (simplified)
-                sentence_start = max(0, text.rfind(".", 0, start_index) + 1)
-                sentence_end = text.find(".", end_index)
-                if sentence_end == -1:
-                    sentence_end = len(text)
-                
-                context = text[sentence_start:sentence_end].strip()
-                
-                issues.append({
-                    "message": weak["message"],
-                    "replacements": [{"value": weak["replacement"]}],
-                    "offset": start_index,
-                    "length": len(word),
-                    "context": {
-                        "text": context,
-                        "offset": start_index - sentence_start
-                    },
-                    "rule": {
+                ))
+            else:
+                # Weak words (simplified)
+                weak_issues.append(self._build_mock_issue(
+                    text, boundaries, start_index, end_index - start_index,
+                    message=weak["message"],
+                    replacement=weak["replacement"],
+                    rule={
                         "id": "WEAK_WORD",
                         "description": "Use of weak or vague words",
                         "issueType": "style"
                     }
-                })
+                ))
         
-        return issues
+        return passive_issues + weak_issues
+    
+    def _build_mock_issue(self, text, boundaries, start_index, length, message, replacement, rule):
+        """
+        Build a mock issue in the LanguageTool match format
+        
+        Args:
+            text: Original text
+            boundaries: Sorted sentence end offsets, starting with -1 and
+                        ending with len(text)
+            start_index: Offset of the issue in the text
+            length: Length of the issue
+            message: Issue message
+            replacement: Suggested replacement
+            rule: Rule description
+            
+        Returns:
+            dict: Issue in LanguageTool format
+        """
+        end_index = start_index + length
+        
+        # Find the full containing sentence (simplified) by binary search
+        # over the precomputed sentence boundaries
+        sentence_start = boundaries[bisect.bisect_left(boundaries, start_index) - 1] + 1
+        sentence_end = boundaries[bisect.bisect_left(boundaries, end_index)]
+        
+        context = text[sentence_start:sentence_end].strip()
+        
+        return {
+            "message": message,
+            "replacements": [{"value": replacement}],
+            "offset": start_index,
+            "length": length,
+            "context": {
+                "text": context,
+                "offset": start_index - sentence_start
+            },
+            "rule": rule
+        }
     
     def apply_corrections(self, text, issues=None):
         """
@@ -163,24 +292,29 @@ class LanguageToolClient:
         if not issues:
             return text
         
-        # Sort issues by offset in reverse order to avoid changing offsets
-        sorted_issues = sorted(issues, key=lambda x: x.get("offset", 0), reverse=True)
+        # Sort issues by offset and walk the text once, collecting unchanged
+        # slices and replacements to join at the end
+        sorted_issues = sorted(issues, key=lambda x: x.get("offset", 0))
         
         # Apply corrections
-        corrected_text = text
+        parts = []
+        cursor = 0
         for issue in sorted_issues:
             offset = issue.get("offset", 0)
             length = issue.get("length", 0)
             replacements = issue.get("replacements", [])
             
-            if replacements:
-                # Use the first replacement
-                replacement = replacements[0].get("value", "")
-                
-                # Replace the text
-                corrected_text = corrected_text[:offset] + replacement + corrected_text[offset + length:]
+            # Skip issues overlapping a span that was already replaced
+            if not replacements or offset < cursor:
+                continue
+            
+            # Use the first replacement
+            parts.append(text[cursor:offset])
+            parts.append(replacements[0].get("value", ""))
+            cursor = offset + length
         
-        return corrected_text
+        parts.append(text[cursor:])
+        return "".join(parts)
     
     def get_style_suggestions(self, text, section_type=None):
         """
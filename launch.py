@@ -8,6 +8,7 @@ import os
 import sys
 import subprocess
 import time
+import importlib
 
 def clear_screen():
     """Clear the terminal screen based on OS"""
@@ -40,6 +41,8 @@ def install_enhanced_dependencies():
             "transformers==4.30.2", 
             "torch==2.0.1"
         ])
+        # Let the in-process app launch see the newly installed packages
+        importlib.invalidate_caches()
         print("\n✅ Enhanced dependencies installed successfully!")
     except subprocess.CalledProcessError:
         print("\n❌ Failed to install enhanced dependencies.")
@@ -51,13 +54,15 @@ def install_enhanced_dependencies():
 
 def run_app():
     """Run the main application"""
-    print("\nStarting Resume Enhancer...")
     try:
-        script_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "run_app.py")
-        subprocess.check_call([sys.executable, script_path])
-    except subprocess.CalledProcessError:
-        print("\n❌ Failed to start the application.")
-        input("\nPress Enter to continue...")
+        # Run the app launcher in this interpreter instead of starting another one
+        import run_app as app_runner
+        app_runner.run_app()
+    except SystemExit as e:
+        # run_app exits with a non-zero code when dependencies or Streamlit fail
+        if e.code not in (None, 0):
+            print("\n❌ Failed to start the application.")
+            input("\nPress Enter to continue...")
     except KeyboardInterrupt:
         print("\nApplication terminated by user.")
 
@@ -1,19 +1,46 @@
 import io
-import os
-import tempfile
+import time
+import hashlib
+import threading
 import requests
+from collections import OrderedDict
+import fitz  # PyMuPDF
 from pdfminer.high_level import extract_text
 from utils.api_config import API_CONFIG
 
+# Number of recent text-layer extractions kept, keyed by PDF content
+_TEXT_CACHE_SIZE = 32
+
+# (connect, read) timeout in seconds for SmallPDF API requests
+_SMALLPDF_TIMEOUT = (5, 60)
+
+# Polling for OCR results: maximum attempts and the delay bounds in seconds
+# used when the server does not send a Retry-After header
+_OCR_POLL_ATTEMPTS = 10
+_OCR_POLL_DELAY = 1.0
+_OCR_POLL_MAX_DELAY = 8.0
+
+# Statuses meaning the OCR result is not ready yet
+_OCR_PENDING_STATUSES = (202, 429, 503)
+
 class PDFProcessor:
     def __init__(self):
         self.smallpdf_api_key = API_CONFIG["smallpdf"]["api_key"]
         self.smallpdf_api_secret = API_CONFIG["smallpdf"]["api_secret"]
         self.smallpdf_base_url = "https://api.smallpdf.com/v1"
         
+        # Keep-alive session shared by the OCR upload and result polling
+        self._session = requests.Session()
+        self._session.headers.update({'Authorization': f'Bearer {self.smallpdf_api_key}'})
+        
+        # Cache of text extracted from each PDF's text layer, so re-uploads of
+        # the same file skip parsing
+        self._text_cache = OrderedDict()
+        self._text_cache_lock = threading.Lock()
+        
     def extract_text_from_pdf(self, pdf_file, use_ocr=False):
         """
-        Extract text from a PDF file using pdfminer.six
+        Extract text from a PDF file using PyMuPDF, falling back to pdfminer.six
         If OCR is requested or the extracted text is minimal, use SmallPDF OCR API
         
         Args:
@@ -27,8 +54,7 @@ class PDFProcessor:
             # Convert the uploaded file to bytes
             pdf_bytes = pdf_file.getvalue()
             
-            # First attempt: Try pdfminer.six for text extraction
-            extracted_text = extract_text(io.BytesIO(pdf_bytes))
+            extracted_text = self._extract_text_layer(pdf_bytes)
             
             # If text is minimal or OCR is requested, use SmallPDF OCR
             if len(extracted_text.strip()) < 100 or use_ocr:
@@ -42,6 +68,40 @@ class PDFProcessor:
         except Exception as e:
             return f"Error extracting text from PDF: {str(e)}"
     
+    def _extract_text_layer(self, pdf_bytes):
+        """
+        Extract the embedded text of a PDF, reusing the result for repeat uploads
+        
+        Args:
+            pdf_bytes: PDF file as bytes
+            
+        Returns:
+            str: Extracted text (empty if the PDF has no text layer)
+        """
+        key = hashlib.blake2b(pdf_bytes, digest_size=16).digest()
+        with self._text_cache_lock:
+            if key in self._text_cache:
+                self._text_cache.move_to_end(key)
+                return self._text_cache[key]
+        
+        # First attempt: Try PyMuPDF for text extraction
+        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+        try:
+            extracted_text = "\n\n".join(page.get_text("text") for page in doc)
+        finally:
+            doc.close()
+        
+        # Second attempt: Try pdfminer.six if PyMuPDF found no text
+        if not extracted_text.strip():
+            extracted_text = extract_text(io.BytesIO(pdf_bytes))
+        
+        with self._text_cache_lock:
+            self._text_cache[key] = extracted_text
+            if len(self._text_cache) > _TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        
+        return extracted_text
+    
     def _extract_with_smallpdf_ocr(self, pdf_bytes):
         """
         Use SmallPDF API to perform OCR on a PDF file
@@ -53,23 +113,13 @@ class PDFProcessor:
             str: Extracted text using OCR
         """
         try:
-            # Create a temporary file for the PDF
-            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as temp_pdf:
-                temp_pdf.write(pdf_bytes)
-                temp_pdf_path = temp_pdf.name
-            
-            # Step 1: OCR the PDF using SmallPDF API
-            headers = {
-                'Authorization': f'Bearer {self.smallpdf_api_key}',
-                'Content-Type': 'application/pdf'
-            }
-            
-            with open(temp_pdf_path, 'rb') as f:
-                ocr_response = requests.post(
-                    f"{self.smallpdf_base_url}/ocr",
-                    headers=headers,
-                    data=f
-                )
+            # Step 1: OCR the PDF using SmallPDF API, sending the bytes directly
+            ocr_response = self._session.post(
+                f"{self.smallpdf_base_url}/ocr",
+                headers={'Content-Type': 'application/pdf'},
+                data=pdf_bytes,
+                timeout=_SMALLPDF_TIMEOUT
+            )
             
             if ocr_response.status_code != 200:
                 return f"OCR request failed with status {ocr_response.status_code}: {ocr_response.text}"
@@ -77,24 +127,45 @@ class PDFProcessor:
             ocr_task_id = ocr_response.json().get('taskId')
             
             # Step 2: Wait for OCR to complete and retrieve the text
-            text_response = requests.get(
-                f"{self.smallpdf_base_url}/ocr/{ocr_task_id}/text",
-                headers={
-                    'Authorization': f'Bearer {self.smallpdf_api_key}'
-                }
-            )
+            delay = _OCR_POLL_DELAY
+            for attempt in range(_OCR_POLL_ATTEMPTS):
+                text_response = self._session.get(
+                    f"{self.smallpdf_base_url}/ocr/{ocr_task_id}/text",
+                    timeout=_SMALLPDF_TIMEOUT
+                )
+                
+                if text_response.status_code not in _OCR_PENDING_STATUSES:
+                    break
+                
+                if attempt < _OCR_POLL_ATTEMPTS - 1:
+                    time.sleep(self._retry_after(text_response, delay))
+                    delay = min(delay * 2, _OCR_POLL_MAX_DELAY)
             
             if text_response.status_code != 200:
                 return f"OCR text retrieval failed with status {text_response.status_code}: {text_response.text}"
             
-            # Cleanup temp file
-            os.unlink(temp_pdf_path)
-            
             # Return the OCR text
             return text_response.json().get('text', '')
             
         except Exception as e:
             return f"Error using SmallPDF OCR: {str(e)}"
+    
+    def _retry_after(self, response, default):
+        """
+        Get how long to wait before polling again
+        
+        Args:
+            response: Response that reported the result as not ready
+            default: Delay in seconds to use if the server gives none
+            
+        Returns:
+            float: Delay in seconds
+        """
+        try:
+            return min(float(response.headers.get('Retry-After', default)), _OCR_POLL_MAX_DELAY)
+        except (TypeError, ValueError):
+            # Retry-After may also be an HTTP date; fall back to our own backoff
+            return default
 
     def get_pdf_metadata(self, pdf_file):
         """
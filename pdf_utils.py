@@ -1,27 +1,112 @@
 import io
 import os
 import tempfile
+import hashlib
+import threading
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import PyPDF2
 import fitz  # PyMuPDF
 from pdfminer.high_level import extract_text
-import docx2pdf
-import docx
-import textract
 import re
-from PIL import Image
-import pytesseract
-import numpy as np
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, ListFlowable, ListItem
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib import colors
-from reportlab.lib.units import inch
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
+from PIL import Image, ImageStat
+
+try:
+    import pypdfium2 as pdfium
+    PYPDFIUM2_AVAILABLE = True
+except ImportError:
+    PYPDFIUM2_AVAILABLE = False
+
+# textract, python-docx, tesserocr, pytesseract and reportlab are imported in
+# the functions that use them: they are slow to import and most uploads only
+# need the PyMuPDF fast path
+
+# Maximum number of worker processes used to OCR the pages of one document
+_MAX_OCR_WORKERS = 4
+
+# Maximum number of worker processes used to extract a batch of files
+_MAX_BATCH_WORKERS = 8
+
+# Pages of a PDF's text layer extracted in-process; if the character limit
+# has not been reached by then, the remaining pages are extracted in page
+# ranges by up to _MAX_PAGE_WORKERS worker processes
+_PARALLEL_PAGE_THRESHOLD = 32
+_MAX_PAGE_WORKERS = 8
+
+# Text extraction stops after the page that takes the text past this many
+# characters, far more than any resume, so huge uploads are not fully parsed
+_MAX_EXTRACTED_CHARS = 50000
+
+# Number of recent extraction results kept, keyed by file content and name
+_EXTRACT_CACHE_SIZE = 32
+_EXTRACT_CACHE = OrderedDict()
+_EXTRACT_CACHE_LOCK = threading.Lock()
+
+# Resolution pages are rendered at for OCR
+_OCR_DPI = 200
+
+# Tesseract options: treat each page as a single uniform block of text
+_OCR_CONFIG = '--psm 6'
+
+# Per-thread tesserocr engines; an engine must not be shared between threads
+_TESSERACT_LOCAL = threading.local()
+
+# Lookup table binarizing 8-bit grayscale pixels for OCR
+_THRESHOLD_TABLE = [255 if value > 128 else 0 for value in range(256)]
+
+# Pages whose sampled pixels are at least this spread out and mostly near
+# black or white are already clean enough for OCR without thresholding
+_HIGH_CONTRAST_STDDEV = 60
+_HIGH_CONTRAST_EXTREME_FRACTION = 0.9
+
+# Common section headers in resumes, in priority order
+_SECTION_PATTERNS = {
+    "personal_info": r"(personal\s+information|contact|profile)",
+    "summary": r"(summary|objective|professional\s+summary|about\s+me)",
+    "education": r"(education|academic|qualifications|degrees)",
+    "experience": r"(experience|work\s+experience|employment|work\s+history)",
+    "skills": r"(skills|technical\s+skills|competencies|expertise)",
+    "projects": r"(projects|personal\s+projects|academic\s+projects)",
+    "certifications": r"(certifications|certificates|credentials)",
+    "awards": r"(awards|honors|achievements)",
+    "languages": r"(languages|language\s+proficiency)",
+    "publications": r"(publications|papers|research)",
+    "references": r"(references|referees)"
+}
+
+# Matches a line containing any section header; the alternatives are
+# lookaheads tried in priority order, so lastgroup names the same section a
+# search with each pattern in turn would have found first
+_SECTION_RE = re.compile(
+    "|".join(f"(?=.*?(?P<{section}>{pattern}))" for section, pattern in _SECTION_PATTERNS.items()),
+    re.IGNORECASE
+)
+# Matches a whole line mentioning any section keyword, scanning the full text
+_SECTION_LINE_RE = re.compile(
+    r"^(?=[^\n]*?(?:" + "|".join(_SECTION_PATTERNS.values()) + r"))[^\n]*",
+    re.IGNORECASE | re.MULTILINE
+)
+_ALL_CAPS_RE = re.compile(r'^[A-Z\s]+$')
+
+# Contact information patterns
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RE = re.compile(r'(?:\+\d{1,3}[- ]?)?\(?(?:\d{3})?\)?[- ]?\d{3}[- ]?\d{4}')
+_LINKEDIN_RE = re.compile(r'(?:linkedin\.com/in/|linkedin:)([A-Za-z0-9_-]+)', re.IGNORECASE)
+_GITHUB_RE = re.compile(r'(?:github\.com/|github:)([A-Za-z0-9_-]+)', re.IGNORECASE)
+_WEBSITE_RE = re.compile(r'(?:https?://)?(?:www\.)?([A-Za-z0-9][-A-Za-z0-9]{0,62}(?:\.[A-Za-z0-9][-A-Za-z0-9]{0,62})+)')
+
+# Domains that are likely not personal websites
+_NON_PERSONAL_DOMAINS = ('linkedin', 'github', 'google', 'facebook', 'twitter')
 
 def extract_text_from_pdf(file):
     """
     Extract text content from a PDF file with enhanced extraction capabilities
     
+    Results are cached by file content, so re-uploading the same file skips
+    extraction entirely.
+    
     Args:
         file: File buffer from Streamlit file uploader
     
@@ -29,9 +114,109 @@ def extract_text_from_pdf(file):
         str: Extracted text from the PDF
         dict: Additional metadata (if available)
     """
-    # Reset file pointer
-    file.seek(0)
+    filename = file.name if hasattr(file, 'name') else 'uploaded_file'
+    key = _extraction_key(file.getvalue(), filename)
+    
+    cached = _get_cached_extraction(key)
+    if cached is not None:
+        return cached
+    
+    text, metadata = _extract_text(file)
+    _cache_extraction(key, text, metadata)
+    return text, metadata
+
+def extract_text_from_pdfs(files, max_workers=None):
+    """
+    Extract text content from several uploaded files in parallel
+    
+    Each file is extracted in its own worker process, so independent uploads
+    are processed concurrently instead of one after another.
+    
+    Args:
+        files: File buffers from Streamlit file uploader
+        max_workers: Maximum number of worker processes (default: CPU count, up to 8)
+    
+    Returns:
+        list: (text, metadata) tuple for each file, in the same order as files
+    """
+    uploads = [
+        (file.getvalue(), file.name if hasattr(file, 'name') else 'uploaded_file')
+        for file in files
+    ]
+    keys = [_extraction_key(file_bytes, filename) for file_bytes, filename in uploads]
+    results = [_get_cached_extraction(key) for key in keys]
     
+    pending = [index for index, result in enumerate(results) if result is None]
+    if len(pending) == 1:
+        index = pending[0]
+        results[index] = _extract_upload(*uploads[index])
+    elif pending:
+        # Spawn fresh workers rather than forking the Streamlit server process
+        with ProcessPoolExecutor(
+            max_workers=max_workers or min(os.cpu_count() or 1, _MAX_BATCH_WORKERS, len(pending)),
+            mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            extracted = executor.map(_extract_upload, *zip(*(uploads[index] for index in pending)))
+            for index, result in zip(pending, extracted):
+                results[index] = result
+    
+    for index in pending:
+        _cache_extraction(keys[index], *results[index])
+    
+    return results
+
+def _extract_upload(file_bytes, filename):
+    """
+    Extract text from uploaded file content; runs in batch worker processes
+    
+    Args:
+        file_bytes: File content
+        filename: Original filename, used to pick the extraction method
+    
+    Returns:
+        str: Extracted text
+        dict: Additional metadata (if available)
+    """
+    file = io.BytesIO(file_bytes)
+    file.name = filename
+    return _extract_text(file)
+
+def _extraction_key(file_bytes, filename):
+    """Return the extraction cache key for file content and name"""
+    return hashlib.blake2b(file_bytes, digest_size=16).digest(), filename
+
+def _get_cached_extraction(key):
+    """Return a copy of the cached (text, metadata) for key, or None on a miss"""
+    with _EXTRACT_CACHE_LOCK:
+        cached = _EXTRACT_CACHE.get(key)
+        if cached is None:
+            return None
+        _EXTRACT_CACHE.move_to_end(key)
+    text, metadata = cached
+    return text, dict(metadata)
+
+def _cache_extraction(key, text, metadata):
+    """Store an extraction result, evicting the least recently used entry"""
+    # Failures are not cached so a retry runs the extractors again
+    if text.startswith("Error"):
+        return
+    with _EXTRACT_CACHE_LOCK:
+        _EXTRACT_CACHE[key] = (text, dict(metadata))
+        _EXTRACT_CACHE.move_to_end(key)
+        if len(_EXTRACT_CACHE) > _EXTRACT_CACHE_SIZE:
+            _EXTRACT_CACHE.popitem(last=False)
+
+def _extract_text(file):
+    """
+    Extract text content from a file, trying each extraction method in turn
+    
+    Args:
+        file: File buffer from Streamlit file uploader
+    
+    Returns:
+        str: Extracted text from the PDF
+        dict: Additional metadata (if available)
+    """
     # Get the filename and extension
     filename = file.name if hasattr(file, 'name') else 'uploaded_file'
     extension = os.path.splitext(filename)[1].lower()
@@ -47,11 +232,75 @@ def extract_text_from_pdf(file):
     if extension != '.pdf':
         return convert_and_extract(file, extension, metadata)
     
+    # Read the file once; every in-memory method below works from these bytes
+    pdf_bytes = file.getvalue()
+    
     # Try different extraction methods for PDFs
-    # Method 1: PyPDF2
+    # Method 1: PyMuPDF (fitz)
     try:
-        text = ""
-        pdf_reader = PyPDF2.PdfReader(file)
+        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+        metadata["pages"] = doc.page_count
+        
+        # Extract document info
+        for key, value in doc.metadata.items():
+            if value and key != "format":
+                metadata[key.lower()] = value
+        
+        page_texts = []
+        extracted_chars = 0
+        for page_text in _iter_page_texts(doc, pdf_bytes):
+            page_texts.append(page_text)
+            extracted_chars += len(page_text)
+            if extracted_chars > _MAX_EXTRACTED_CHARS:
+                break
+        text = "".join(page_texts)
+        
+        doc.close()
+        
+        # If we got substantial text, return it
+        if len(text.strip()) > 200:
+            return text, metadata
+    except Exception as e:
+        print(f"PyMuPDF extraction failed: {str(e)}")
+    
+    # Method 2: pypdfium2, a C extractor much faster than PyPDF2
+    if PYPDFIUM2_AVAILABLE:
+        try:
+            pdf = pdfium.PdfDocument(pdf_bytes)
+            try:
+                metadata["pages"] = len(pdf)
+                
+                # Extract document info
+                for key, value in pdf.get_metadata_dict().items():
+                    if value:
+                        metadata[key.lower()] = value
+                
+                # Extract text from each page, joining the pages once at the end
+                page_texts = []
+                extracted_chars = 0
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    page_text = textpage.get_text_range().replace("\r\n", "\n")
+                    textpage.close()
+                    page.close()
+                    
+                    page_texts.append(page_text + "\n\n")
+                    extracted_chars += len(page_text) + 2
+                    if extracted_chars > _MAX_EXTRACTED_CHARS:
+                        break
+                text = "".join(page_texts)
+            finally:
+                pdf.close()
+            
+            # If we got substantial text, return it
+            if len(text.strip()) > 200:
+                return text, metadata
+        except Exception as e:
+            print(f"pypdfium2 extraction failed: {str(e)}")
+    
+    # Method 3: PyPDF2
+    try:
+        pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
         metadata["pages"] = len(pdf_reader.pages)
         
         # Extract document info
@@ -61,11 +310,17 @@ def extract_text_from_pdf(file):
                     clean_key = key[1:].lower()
                     metadata[clean_key] = value
         
-        # Extract text from each page
+        # Extract text from each page, joining the pages once at the end
+        page_texts = []
+        extracted_chars = 0
         for page in pdf_reader.pages:
             page_text = page.extract_text()
             if page_text:
-                text += page_text + "\n\n"
+                page_texts.append(page_text + "\n\n")
+                extracted_chars += len(page_text) + 2
+                if extracted_chars > _MAX_EXTRACTED_CHARS:
+                    break
+        text = "".join(page_texts)
         
         # If we got substantial text, return it
         if len(text.strip()) > 200:
@@ -73,37 +328,9 @@ def extract_text_from_pdf(file):
     except Exception as e:
         print(f"PyPDF2 extraction failed: {str(e)}")
     
-    # Method 2: PyMuPDF (fitz)
+    # Method 4: PDFMiner
     try:
-        file.seek(0)
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-            temp_file.write(file.getvalue())
-            temp_path = temp_file.name
-        
-        doc = fitz.open(temp_path)
-        metadata["pages"] = doc.page_count
-        
-        text = ""
-        for page in doc:
-            text += page.get_text() + "\n\n"
-        
-        # Clean up the temp file
-        doc.close()
-        os.unlink(temp_path)
-        
-        # If we got substantial text, return it
-        if len(text.strip()) > 200:
-            return text, metadata
-    except Exception as e:
-        print(f"PyMuPDF extraction failed: {str(e)}")
-        # Clean up if file exists
-        if 'temp_path' in locals() and os.path.exists(temp_path):
-            os.unlink(temp_path)
-    
-    # Method 3: PDFMiner
-    try:
-        file.seek(0)
-        text = extract_text(io.BytesIO(file.getvalue()))
+        text = extract_text(io.BytesIO(pdf_bytes))
         
         # If we got substantial text, return it
         if len(text.strip()) > 200:
@@ -111,11 +338,12 @@ def extract_text_from_pdf(file):
     except Exception as e:
         print(f"PDFMiner extraction failed: {str(e)}")
     
-    # Method 4: Textract as a last resort
+    # Method 5: Textract as a last resort; it needs a path on disk
     try:
-        file.seek(0)
+        import textract
+        
         with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-            temp_file.write(file.getvalue())
+            temp_file.write(pdf_bytes)
             temp_path = temp_file.name
         
         text = textract.process(temp_path, method='pdfminer').decode('utf-8')
@@ -132,7 +360,6 @@ def extract_text_from_pdf(file):
     
     # If all methods failed, try OCR
     try:
-        file.seek(0)
         text = extract_with_ocr(file)
         if text:
             metadata["extraction_method"] = "ocr"
@@ -143,6 +370,103 @@ def extract_text_from_pdf(file):
     # If all extractions fail
     return "Error: Could not extract text from the document. Please ensure it contains selectable text or try another file.", metadata
 
+def _page_text(page):
+    """
+    Get the text of a PyMuPDF page in reading order
+    
+    Args:
+        page: PyMuPDF page
+    
+    Returns:
+        str: Page text
+    """
+    # Block-level output sorted top-to-bottom, left-to-right; block type 0 is
+    # text (type 1 blocks are images)
+    text = "\n".join(block[4] for block in page.get_text("blocks", sort=True) if block[6] == 0)
+    
+    # Fall back to plain text mode for pages the block output misses
+    return text or page.get_text("text")
+
+def _iter_page_texts(doc, pdf_bytes):
+    """
+    Yield the text of each page of an open PDF, in page order
+    
+    The first pages are extracted in-process, which is all most documents
+    need before the caller's character limit is reached. Pages after those
+    are extracted in parallel page ranges.
+    
+    Args:
+        doc: Open PyMuPDF document
+        pdf_bytes: Content of the document, for worker processes to reopen
+    
+    Yields:
+        str: Page text followed by a blank line
+    """
+    for page in doc.pages(0, min(doc.page_count, _PARALLEL_PAGE_THRESHOLD)):
+        yield _page_text(page) + "\n\n"
+    
+    if doc.page_count > _PARALLEL_PAGE_THRESHOLD:
+        yield from _extract_pages_in_parallel(pdf_bytes, _PARALLEL_PAGE_THRESHOLD, doc.page_count)
+
+def _extract_pages_in_parallel(pdf_bytes, start, end):
+    """
+    Extract the text of pages start to end - 1 of a PDF, sharding the
+    page range across worker processes
+    
+    Args:
+        pdf_bytes: PDF file content
+        start: Index of the first page
+        end: Index after the last page
+    
+    Returns:
+        list: Text of each extracted page, in page order
+    """
+    workers = min(os.cpu_count() or 1, _MAX_PAGE_WORKERS)
+    if workers < 2:
+        return _extract_range(pdf_bytes, start, end)
+    
+    shard_size = -(-(end - start) // workers)
+    starts = range(start, end, shard_size)
+    ends = [min(shard_start + shard_size, end) for shard_start in starts]
+    
+    # Spawn fresh workers rather than forking the Streamlit server process
+    with ProcessPoolExecutor(
+        max_workers=len(starts),
+        mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        shards = executor.map(partial(_extract_range, pdf_bytes), starts, ends)
+        return [page_text for shard in shards for page_text in shard]
+
+def _extract_range(pdf_bytes, start, end):
+    """
+    Extract the text of pages start to end - 1 of a PDF
+    
+    Usually runs in a worker process, so the document is reopened from its
+    bytes.
+    
+    Args:
+        pdf_bytes: PDF file content
+        start: Index of the first page
+        end: Index after the last page
+    
+    Returns:
+        list: Text of each extracted page; extraction stops early once the
+              range alone passes the character limit
+    """
+    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    try:
+        page_texts = []
+        extracted_chars = 0
+        for page_num in range(start, end):
+            page_text = _page_text(doc[page_num]) + "\n\n"
+            page_texts.append(page_text)
+            extracted_chars += len(page_text)
+            if extracted_chars > _MAX_EXTRACTED_CHARS:
+                break
+        return page_texts
+    finally:
+        doc.close()
+
 def convert_and_extract(file, extension, metadata):
     """
     Convert non-PDF file to PDF and extract text
@@ -163,16 +487,29 @@ def convert_and_extract(file, extension, metadata):
         temp_input.write(file.getvalue())
         input_path = temp_input.name
     
-    output_path = input_path.replace(extension, '.pdf')
     metadata["converted_from"] = extension
     
     try:
         # Handle different file types
+        if extension in ['.doc', '.txt', '.rtf', '.odt']:
+            import textract
+        
         if extension in ['.docx', '.doc']:
-            # Convert Word to PDF
             if extension == '.docx':
+                # Read the text straight from the document; rendering it to PDF
+                # first would start a word processor for every upload
+                import docx
+                
                 doc = docx.Document(input_path)
-                docx2pdf.convert(input_path, output_path)
+                lines = [paragraph.text for paragraph in doc.paragraphs]
+                for table in doc.tables:
+                    for row in table.rows:
+                        lines.append("\t".join(cell.text for cell in row.cells))
+                
+                text = "\n".join(lines)
+                metadata["extraction_method"] = "python-docx"
+                os.unlink(input_path)
+                return text, metadata
             else:
                 # For .doc, use textract to extract directly
                 text = textract.process(input_path).decode('utf-8')
@@ -194,16 +531,17 @@ def convert_and_extract(file, extension, metadata):
             os.unlink(input_path)
             return text, metadata
         
-        # Extract text from the converted PDF
-        with open(output_path, 'rb') as pdf_file:
-            pdf_content = pdf_file.read()
-            pdf_io = io.BytesIO(pdf_content)
-            text, _ = extract_text_from_pdf(pdf_io)
+        # Other document formats PyMuPDF can read (XPS, EPUB, ...) are opened
+        # in-process, with no intermediate PDF to write and parse again
+        doc = fitz.open(input_path)
+        try:
+            metadata["pages"] = doc.page_count
+            text = "".join(_page_text(page) + "\n\n" for page in doc)
+        finally:
+            doc.close()
         
         # Clean up temporary files
         os.unlink(input_path)
-        if os.path.exists(output_path):
-            os.unlink(output_path)
         
         return text, metadata
     
@@ -211,8 +549,6 @@ def convert_and_extract(file, extension, metadata):
         # Clean up on failure
         if os.path.exists(input_path):
             os.unlink(input_path)
-        if os.path.exists(output_path):
-            os.unlink(output_path)
         
         return f"Error converting {extension} to PDF: {str(e)}", metadata
 
@@ -220,6 +556,8 @@ def extract_with_ocr(file):
     """
     Extract text from an image or scanned PDF using OCR
     
+    Pages are rendered and recognized in parallel worker processes.
+    
     Args:
         file: File buffer
     
@@ -227,46 +565,81 @@ def extract_with_ocr(file):
         str: Extracted text
     """
     file.seek(0)
+    pdf_bytes = file.getvalue()
     
-    # Create a temporary file
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-        temp_file.write(file.getvalue())
-        temp_path = temp_file.name
+    # Open the document only to count its pages; workers reopen it from bytes
+    doc = fitz.open(stream=pdf_bytes)
+    page_count = doc.page_count
+    doc.close()
+    
+    if page_count <= 1:
+        page_texts = [_ocr_page(pdf_bytes, page_num) for page_num in range(page_count)]
+    else:
+        # Spawn fresh workers rather than forking the Streamlit server process
+        with ProcessPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, _MAX_OCR_WORKERS, page_count),
+            mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            page_texts = list(executor.map(partial(_ocr_page, pdf_bytes), range(page_count)))
+    
+    return "".join(page_text + "\n\n" for page_text in page_texts)
+
+def _ocr_page(pdf_bytes, page_num):
+    """
+    Render one page of a document and extract its text with OCR
+    
+    Args:
+        pdf_bytes: Document file content
+        page_num: Zero-based index of the page to process
     
+    Returns:
+        str: Extracted text of the page
+    """
+    doc = fitz.open(stream=pdf_bytes)
     try:
-        # Open PDF with PyMuPDF
-        doc = fitz.open(temp_path)
-        text = ""
+        page = doc.load_page(page_num)
         
-        # Process each page
-        for page_num in range(doc.page_count):
-            page = doc.load_page(page_num)
-            
-            # Convert page to image
-            pix = page.get_pixmap()
-            img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-            
-            # Apply image preprocessing to improve OCR
-            img = preprocess_image(img)
-            
-            # Extract text with OCR
-            page_text = pytesseract.image_to_string(img)
-            text += page_text + "\n\n"
+        # Convert page to a grayscale image; rendering in gray avoids an RGB to
+        # gray conversion and a higher resolution improves recognition
+        pix = page.get_pixmap(colorspace=fitz.csGRAY, dpi=_OCR_DPI)
         
-        # Clean up
-        doc.close()
-        os.unlink(temp_path)
+        # Wrap the sample bytes instead of copying them into a new image
+        # buffer; the image keeps a reference to the bytes object it wraps
+        img = Image.frombuffer("L", (pix.width, pix.height), pix.samples, "raw", "L", pix.stride, 1)
         
-        return text
-    
-    except Exception as e:
-        # Clean up on failure
-        if 'doc' in locals():
-            doc.close()
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
+        # Apply image preprocessing to improve OCR
+        img = preprocess_image(img)
+        
+        # Extract text with OCR, preferring the in-process tesseract engine
+        api = _tesseract_api()
+        if api is not None:
+            api.SetImage(img)
+            return api.GetUTF8Text()
         
-        raise e
+        import pytesseract
+        return pytesseract.image_to_string(img, config=_OCR_CONFIG)
+    finally:
+        doc.close()
+
+def _tesseract_api():
+    """
+    Get this thread's persistent tesserocr engine
+    
+    The engine keeps its language model loaded between pages, unlike
+    pytesseract, which starts a tesseract process for every page.
+    
+    Returns:
+        PyTessBaseAPI: Initialized engine, or None if tesserocr is not installed
+    """
+    api = getattr(_TESSERACT_LOCAL, "api", None)
+    if api is None:
+        try:
+            import tesserocr
+            api = tesserocr.PyTessBaseAPI(psm=tesserocr.PSM.SINGLE_BLOCK)
+        except ImportError:
+            api = False
+        _TESSERACT_LOCAL.api = api
+    return api or None
 
 def preprocess_image(img):
     """
@@ -278,20 +651,22 @@ def preprocess_image(img):
     Returns:
         PIL Image: Processed image
     """
-    # Convert to numpy array
-    img_np = np.array(img)
-    
-    # Convert to grayscale if it's not already
-    if len(img_np.shape) == 3:
-        img_gray = np.dot(img_np[...,:3], [0.2989, 0.5870, 0.1140])
-    else:
-        img_gray = img_np
+    # Convert to grayscale (a no-op for images that already are)
+    img_gray = img.convert("L")
     
-    # Apply thresholding to make text stand out
-    img_binary = (img_gray > 128).astype(np.uint8) * 255
+    # Skip thresholding for pages that are already black-on-white, as most
+    # rendered born-digital pages are; nearest-neighbour sampling keeps the
+    # thumbnail's pixel values from being blurred into grays
+    thumb = img_gray.resize((64, 64), Image.NEAREST)
+    histogram = thumb.histogram()
+    extreme_fraction = (sum(histogram[:64]) + sum(histogram[193:])) / (64 * 64)
+    if (ImageStat.Stat(thumb).stddev[0] > _HIGH_CONTRAST_STDDEV
+            and extreme_fraction > _HIGH_CONTRAST_EXTREME_FRACTION):
+        return img_gray
     
-    # Convert back to PIL Image
-    return Image.fromarray(img_binary.astype(np.uint8))
+    # Apply thresholding to make text stand out; Pillow applies the lookup
+    # table in C on 8-bit pixels
+    return img_gray.point(_THRESHOLD_TABLE)
 
 def analyze_resume_structure(text):
     """
@@ -303,63 +678,70 @@ def analyze_resume_structure(text):
     Returns:
         dict: Identified sections and their positions
     """
-    # Common section headers in resumes
-    section_patterns = {
-        "personal_info": r"(?i)(personal\s+information|contact|profile)",
-        "summary": r"(?i)(summary|objective|professional\s+summary|about\s+me)",
-        "education": r"(?i)(education|academic|qualifications|degrees)",
-        "experience": r"(?i)(experience|work\s+experience|employment|work\s+history)",
-        "skills": r"(?i)(skills|technical\s+skills|competencies|expertise)",
-        "projects": r"(?i)(projects|personal\s+projects|academic\s+projects)",
-        "certifications": r"(?i)(certifications|certificates|credentials)",
-        "awards": r"(?i)(awards|honors|achievements)",
-        "languages": r"(?i)(languages|language\s+proficiency)",
-        "publications": r"(?i)(publications|papers|research)",
-        "references": r"(?i)(references|referees)"
-    }
-    
     sections = {}
-    lines = text.split('\n')
     
     current_section = None
-    section_content = []
+    section_offset = 0
+    
+    # Line number of the most recent candidate, counted incrementally
+    line_number = 0
+    counted_to = 0
     
-    for i, line in enumerate(lines):
-        line = line.strip()
-        if not line:
+    # Scan the whole text once for lines mentioning a section keyword; only
+    # those lines need the per-line header checks
+    for candidate in _SECTION_LINE_RE.finditer(text):
+        line = candidate.group(0).strip()
+        
+        # Check if this line is a section header, testing every section
+        # pattern in one regex scan
+        header = None
+        if len(line) < 50 or _ALL_CAPS_RE.match(line):
+            header = _SECTION_RE.match(line)
+        
+        if not header:
             continue
         
-        # Check if this line is a section header
-        for section, pattern in section_patterns.items():
-            if re.search(pattern, line) and (len(line) < 50 or re.match(r'^[A-Z\s]+$', line)):
-                # If we were in a section, save it before starting a new one
-                if current_section:
-                    sections[current_section] = {
-                        "content": '\n'.join(section_content),
-                        "line_start": sections[current_section].get("line_start"),
-                        "line_end": i - 1
-                    }
-                
-                # Start new section
-                current_section = section
-                section_content = []
-                sections[current_section] = {"line_start": i}
-                break
+        line_number += text.count('\n', counted_to, candidate.start())
+        counted_to = candidate.start()
         
-        # If we're in a section, add this line to the content
+        # If we were in a section, save it before starting a new one
         if current_section:
-            section_content.append(line)
+            sections[current_section] = {
+                "content": _section_content(text, section_offset, candidate.start()),
+                "line_start": sections[current_section].get("line_start"),
+                "line_end": line_number - 1
+            }
+        
+        # Start new section
+        current_section = header.lastgroup
+        section_offset = candidate.start()
+        sections[current_section] = {"line_start": line_number}
     
     # Save the last section
-    if current_section and section_content:
+    if current_section:
         sections[current_section] = {
-            "content": '\n'.join(section_content),
+            "content": _section_content(text, section_offset, len(text)),
             "line_start": sections[current_section].get("line_start"),
-            "line_end": len(lines) - 1
+            "line_end": text.count('\n')
         }
     
     return sections
 
+def _section_content(text, start, end):
+    """
+    Collect the non-empty, stripped lines of a section
+    
+    Args:
+        text: Extracted text from resume
+        start: Offset of the section header line
+        end: Offset just past the section's last line
+    
+    Returns:
+        str: Section content, one line per row
+    """
+    lines = (line.strip() for line in text[start:end].split('\n'))
+    return '\n'.join(line for line in lines if line)
+
 def extract_contact_info(text):
     """
     Extract contact information from resume text
@@ -378,37 +760,29 @@ def extract_contact_info(text):
         "website": None
     }
     
-    # Email pattern
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    email_matches = re.findall(email_pattern, text)
-    if email_matches:
-        contact_info["email"] = email_matches[0]
-    
-    # Phone pattern
-    phone_pattern = r'(?:\+\d{1,3}[- ]?)?\(?(?:\d{3})?\)?[- ]?\d{3}[- ]?\d{4}'
-    phone_matches = re.findall(phone_pattern, text)
-    if phone_matches:
-        contact_info["phone"] = phone_matches[0]
-    
-    # LinkedIn pattern
-    linkedin_pattern = r'(?:linkedin\.com/in/|linkedin:)([A-Za-z0-9_-]+)'
-    linkedin_matches = re.findall(linkedin_pattern, text, re.IGNORECASE)
-    if linkedin_matches:
-        contact_info["linkedin"] = f"linkedin.com/in/{linkedin_matches[0]}"
-    
-    # GitHub pattern
-    github_pattern = r'(?:github\.com/|github:)([A-Za-z0-9_-]+)'
-    github_matches = re.findall(github_pattern, text, re.IGNORECASE)
-    if github_matches:
-        contact_info["github"] = f"github.com/{github_matches[0]}"
-    
-    # Website pattern
-    website_pattern = r'(?:https?://)?(?:www\.)?([A-Za-z0-9][-A-Za-z0-9]{0,62}(?:\.[A-Za-z0-9][-A-Za-z0-9]{0,62})+)'
-    website_matches = re.findall(website_pattern, text)
+    # Only the first match of each pattern is used, so stop at the first one
+    email_match = _EMAIL_RE.search(text)
+    if email_match:
+        contact_info["email"] = email_match.group(0)
+    
+    phone_match = _PHONE_RE.search(text)
+    if phone_match:
+        contact_info["phone"] = phone_match.group(0)
+    
+    linkedin_match = _LINKEDIN_RE.search(text)
+    if linkedin_match:
+        contact_info["linkedin"] = f"linkedin.com/in/{linkedin_match.group(1)}"
+    
+    github_match = _GITHUB_RE.search(text)
+    if github_match:
+        contact_info["github"] = f"github.com/{github_match.group(1)}"
+    
     # Filter out common domains that are likely not personal websites
-    filtered_matches = [m for m in website_matches if not any(common in m.lower() for common in ['linkedin', 'github', 'google', 'facebook', 'twitter'])]
-    if filtered_matches:
-        contact_info["website"] = filtered_matches[0]
+    for website_match in _WEBSITE_RE.finditer(text):
+        domain = website_match.group(1)
+        if not any(common in domain.lower() for common in _NON_PERSONAL_DOMAINS):
+            contact_info["website"] = domain
+            break
     
     return contact_info
 
@@ -422,6 +796,12 @@ def generate_enhanced_resume_pdf(resume_data):
     Returns:
         bytes: PDF file as bytes
     """
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.lib.enums import TA_CENTER
+    
     # Create an in-memory buffer for the PDF
     buffer = io.BytesIO()
     
@@ -466,6 +846,24 @@ def generate_enhanced_resume_pdf(resume_data):
         firstLineIndent=-0.25*inch,
         spaceBefore=0.1*inch
     ))
+    styles.add(ParagraphStyle(
+        name='BulletBlock',
+        parent=styles['Normal'],
+        leftIndent=0.25*inch
+    ))
+    
+    # Look styles up once rather than per paragraph; spacers carry no
+    # state, so the same instances can be reused throughout
+    normal = styles['Normal']
+    section_hdr = styles['SectionHeader']
+    bullet_style = styles['BulletBlock']
+    spacer = Spacer(1, 0.1*inch)
+    small_spacer = Spacer(1, 0.05*inch)
+    
+    def bullets_paragraph(bullets):
+        # One paragraph with line breaks is much cheaper to parse and lay
+        # out than a ListFlowable holding a paragraph per bullet
+        return Paragraph("<br/>".join(f"\u2022 {bullet}" for bullet in bullets), bullet_style)
     
     # Document elements
     elements = []
@@ -484,17 +882,17 @@ def generate_enhanced_resume_pdf(resume_data):
         
         contact_line = " | ".join(contact_parts)
         elements.append(Paragraph(contact_line, styles['Contact']))
-        elements.append(Spacer(1, 0.1*inch))
+        elements.append(spacer)
     
     # Summary/Objective
     if 'Objective/Resume Summary' in resume_data and resume_data['Objective/Resume Summary']:
-        elements.append(Paragraph('SUMMARY', styles['SectionHeader']))
-        elements.append(Paragraph(resume_data['Objective/Resume Summary'], styles['Normal']))
-        elements.append(Spacer(1, 0.1*inch))
+        elements.append(Paragraph('SUMMARY', section_hdr))
+        elements.append(Paragraph(resume_data['Objective/Resume Summary'], normal))
+        elements.append(spacer)
     
     # Experience
     if 'Work Experience' in resume_data and resume_data['Work Experience']:
-        elements.append(Paragraph('EXPERIENCE', styles['SectionHeader']))
+        elements.append(Paragraph('EXPERIENCE', section_hdr))
         
         for job in resume_data['Work Experience']:
             job_title = job.get('title', 'Position')
@@ -502,25 +900,22 @@ def generate_enhanced_resume_pdf(resume_data):
             date = job.get('duration', 'Date')
             
             job_header = f"<b>{job_title}</b>, {company} | {date}"
-            elements.append(Paragraph(job_header, styles['Normal']))
+            elements.append(Paragraph(job_header, normal))
             
             if 'description' in job:
                 description = job['description']
                 if isinstance(description, list):
                     # Handle list of bullet points
-                    bullet_list = []
-                    for bullet in description:
-                        bullet_list.append(ListItem(Paragraph(bullet, styles['Normal'])))
-                    elements.append(ListFlowable(bullet_list, bulletType='bullet', leftIndent=0.25*inch))
+                    elements.append(bullets_paragraph(description))
                 else:
                     # Handle string description
-                    elements.append(Paragraph(description, styles['Normal']))
+                    elements.append(Paragraph(description, normal))
             
-            elements.append(Spacer(1, 0.1*inch))
+            elements.append(spacer)
     
     # Education
     if 'Education' in resume_data and resume_data['Education']:
-        elements.append(Paragraph('EDUCATION', styles['SectionHeader']))
+        elements.append(Paragraph('EDUCATION', section_hdr))
         
         for edu in resume_data['Education']:
             degree = edu.get('degree', 'Degree')
@@ -528,33 +923,33 @@ def generate_enhanced_resume_pdf(resume_data):
             date = edu.get('date', 'Date')
             
             edu_header = f"<b>{degree}</b>, {institution} | {date}"
-            elements.append(Paragraph(edu_header, styles['Normal']))
+            elements.append(Paragraph(edu_header, normal))
             
             if 'details' in edu and edu['details']:
-                elements.append(Paragraph(edu['details'], styles['Normal']))
+                elements.append(Paragraph(edu['details'], normal))
             
-            elements.append(Spacer(1, 0.1*inch))
+            elements.append(spacer)
     
     # Skills
     if 'Skills' in resume_data and resume_data['Skills']:
-        elements.append(Paragraph('SKILLS', styles['SectionHeader']))
+        elements.append(Paragraph('SKILLS', section_hdr))
         
         skills = resume_data['Skills']
         if isinstance(skills, dict):
             # Skills are categorized
             for category, skill_list in skills.items():
-                elements.append(Paragraph(f"<b>{category}:</b> {', '.join(skill_list)}", styles['Normal']))
-                elements.append(Spacer(1, 0.05*inch))
+                elements.append(Paragraph(f"<b>{category}:</b> {', '.join(skill_list)}", normal))
+                elements.append(small_spacer)
         elif isinstance(skills, list):
             # Skills are a simple list
-            elements.append(Paragraph(', '.join(skills), styles['Normal']))
+            elements.append(Paragraph(', '.join(skills), normal))
         else:
             # Skills is a string
-            elements.append(Paragraph(skills, styles['Normal']))
+            elements.append(Paragraph(skills, normal))
     
     # Projects
     if 'Projects' in resume_data and resume_data['Projects']:
-        elements.append(Paragraph('PROJECTS', styles['SectionHeader']))
+        elements.append(Paragraph('PROJECTS', section_hdr))
         
         for project in resume_data['Projects']:
             name = project.get('name', 'Project Name')
@@ -565,25 +960,22 @@ def generate_enhanced_resume_pdf(resume_data):
             else:
                 project_header = f"<b>{name}</b>"
                 
-            elements.append(Paragraph(project_header, styles['Normal']))
+            elements.append(Paragraph(project_header, normal))
             
             if 'description' in project:
                 description = project['description']
                 if isinstance(description, list):
                     # Handle list of bullet points
-                    bullet_list = []
-                    for bullet in description:
-                        bullet_list.append(ListItem(Paragraph(bullet, styles['Normal'])))
-                    elements.append(ListFlowable(bullet_list, bulletType='bullet', leftIndent=0.25*inch))
+                    elements.append(bullets_paragraph(description))
                 else:
                     # Handle string description
-                    elements.append(Paragraph(description, styles['Normal']))
+                    elements.append(Paragraph(description, normal))
             
-            elements.append(Spacer(1, 0.1*inch))
+            elements.append(spacer)
     
     # Certifications
     if 'Certifications' in resume_data and resume_data['Certifications']:
-        elements.append(Paragraph('CERTIFICATIONS', styles['SectionHeader']))
+        elements.append(Paragraph('CERTIFICATIONS', section_hdr))
         
         for cert in resume_data['Certifications']:
             if isinstance(cert, dict):
@@ -597,11 +989,11 @@ def generate_enhanced_resume_pdf(resume_data):
                 if date:
                     cert_line += f" | {date}"
                 
-                elements.append(Paragraph(cert_line, styles['Normal']))
+                elements.append(Paragraph(cert_line, normal))
             else:
-                elements.append(Paragraph(cert, styles['Normal']))
+                elements.append(Paragraph(cert, normal))
         
-        elements.append(Spacer(1, 0.1*inch))
+        elements.append(spacer)
     
     # Build the PDF
     doc.build(elements)
@@ -622,6 +1014,8 @@ def generate_docx_from_pdf(pdf_data):
     Returns:
         bytes: DOCX file as bytes
     """
+    import docx
+    
     # Create temporary files
     with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as pdf_temp:
         pdf_temp.write(pdf_data)
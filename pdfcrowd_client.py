@@ -1,9 +1,242 @@
 import pdfcrowd
+import gzip
+import hashlib
+import io
+import re
+import tarfile
 import tempfile
 import os
+import threading
+from collections import OrderedDict
 import streamlit as st
 from utils.api_config import API_CONFIG
 
+# Maximum number of idle preconfigured clients kept per template
+_MAX_IDLE_CLIENTS = 8
+
+# Maximum number of generated resume PDFs kept in memory
+_PDF_CACHE_SIZE = 32
+
+def _compress_html(html_content):
+    """
+    Pack HTML into an in-memory .tar.gz archive, which PDFCrowd accepts as
+    stream input, to cut the upload to a fraction of the raw HTML size
+    
+    Args:
+        html_content: HTML content
+        
+    Returns:
+        BytesIO: Archive stream
+    """
+    html_bytes = html_content.encode("utf-8")
+    info = tarfile.TarInfo("index.html")
+    info.size = len(html_bytes)
+    
+    # Level 1 gets most of the size reduction on text at a fraction of the
+    # CPU time of the default level
+    archive = io.BytesIO()
+    with gzip.GzipFile(fileobj=archive, mode="wb", compresslevel=1, mtime=0) as compressed:
+        with tarfile.open(fileobj=compressed, mode="w") as tar:
+            tar.addfile(info, io.BytesIO(html_bytes))
+    
+    archive.seek(0)
+    return archive
+
+def _option_name(method_name):
+    """Return the snake_case option name for a setter (setPageWidth -> page_width)"""
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", method_name[3:]).lower()
+
+# PDFCrowd client setters keyed by snake_case option name, resolved once
+# rather than by building and looking up method names for every option
+_OPTION_SETTERS = {
+    _option_name(method_name): getattr(pdfcrowd.HtmlToPdfClient, method_name)
+    for method_name in dir(pdfcrowd.HtmlToPdfClient)
+    if method_name.startswith("set")
+    and "set" + "".join(part.capitalize() for part in _option_name(method_name).split("_")) == method_name
+}
+
+# Layout shared by every template
+_BASE_CSS = """
+    * {
+        margin: 0;
+        padding: 0;
+        box-sizing: border-box;
+    }
+
+    body {
+        font-family: Arial, sans-serif;
+        color: #333;
+        line-height: 1.5;
+    }
+
+    .resume-container {
+        width: 100%;
+        max-width: 8.5in;
+        margin: 0 auto;
+    }
+
+    h1, h2, h3 {
+        margin-bottom: 0.5rem;
+    }
+
+    .resume-section {
+        margin-bottom: 1.25rem;
+    }
+
+    .section-content {
+        margin-top: 0.3rem;
+    }
+"""
+
+# Complete CSS for each template: the base layout plus template styling
+_TEMPLATE_CSS = {
+    "modern": _BASE_CSS + """
+    body {
+        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+        color: #333;
+    }
+
+    .resume-header {
+        padding-bottom: 1.5rem;
+        margin-bottom: 1.5rem;
+        border-bottom: 2px solid #4361EE;
+    }
+
+    .contact-info {
+        font-size: 0.9rem;
+        color: #555;
+    }
+
+    h2 {
+        color: #4361EE;
+        font-size: 1.3rem;
+        border-bottom: 1px solid #ddd;
+        padding-bottom: 0.3rem;
+    }
+
+    .summary-section {
+        margin-top: 1rem;
+    }
+""",
+    "technical": _BASE_CSS + """
+    body {
+        font-family: 'Courier New', monospace;
+        color: #2c3e50;
+    }
+
+    .resume-header {
+        padding-bottom: 1.5rem;
+        margin-bottom: 1.5rem;
+        border-bottom: 2px solid #3498db;
+    }
+
+    .contact-info {
+        font-size: 0.9rem;
+        color: #555;
+    }
+
+    h2 {
+        color: #3498db;
+        font-size: 1.3rem;
+        border-bottom: 1px solid #ddd;
+        padding-bottom: 0.3rem;
+    }
+
+    .summary-section {
+        margin-top: 1rem;
+    }
+
+    /* Technical template has a side column for skills */
+    @media print {
+        .resume-body {
+            display: grid;
+            grid-template-columns: 70% 30%;
+            grid-gap: 1.5rem;
+        }
+
+        .skills-section {
+            grid-column: 2;
+            grid-row: 1 / span 3;
+            background-color: #f8f9fa;
+            padding: 1rem;
+            border-radius: 5px;
+        }
+    }
+""",
+    "minimalist": _BASE_CSS + """
+    body {
+        font-family: Arial, sans-serif;
+        color: #555;
+        line-height: 1.8;
+    }
+
+    .resume-header {
+        padding-bottom: 1rem;
+        margin-bottom: 1rem;
+        text-align: center;
+    }
+
+    .contact-info {
+        font-size: 0.9rem;
+        text-align: center;
+    }
+
+    h2 {
+        color: #333;
+        font-size: 1.2rem;
+        text-transform: uppercase;
+        letter-spacing: 1px;
+        margin-top: 1.5rem;
+    }
+
+    .summary-section {
+        margin-top: 1rem;
+        text-align: center;
+        font-style: italic;
+    }
+"""
+}
+
+# PDFCrowd options shared by every template
+_TEMPLATE_OPTIONS = {
+    "page_width": "8.5in",
+    "page_height": "11in",
+    "margin_top": "0.5in",
+    "margin_bottom": "0.5in",
+    "margin_left": "0.75in",
+    "margin_right": "0.75in",
+    "header_html": "<div></div>",  # Empty header
+    "footer_html": "<div style='text-align: center; font-size: 8pt; color: #666;'>Page <span class='pdfcrowd-page-number'></span> of <span class='pdfcrowd-page-count'></span></div>"
+}
+
+# HTML document around the template CSS and resume content
+_HTML_PRE = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Professional Resume</title>
+    <style>
+"""
+_HTML_MID = """
+    </style>
+</head>
+<body>
+    <div class="resume-container">
+"""
+_HTML_POST = """
+    </div>
+</body>
+</html>
+"""
+
+# Main resume sections, rendered in this order before any other sections
+_SECTION_ORDER = ("Education", "Work Experience", "Skills", "Projects",
+                  "Certifications", "Languages")
+
+# Sections with a fixed place in the layout; others follow the main sections
+_KNOWN_SECTIONS = frozenset(_SECTION_ORDER) | {"Contact", "Summary"}
+
 class PDFCrowdClient:
     def __init__(self):
         self.config = API_CONFIG["pdfcrowd"]
@@ -11,6 +244,18 @@ class PDFCrowdClient:
         self.api_key = self.config["api_key"]
         self.initialized = self.username is not None and self.api_key is not None
         self.client = None
+        
+        # Idle clients preconfigured for each template. PDFCrowd clients keep
+        # per-conversion state, so each is used by one conversion at a time;
+        # the pool outlives the script thread of any single rerun
+        self._client_pool = {}
+        self._pool_lock = threading.Lock()
+        
+        # LRU cache of generated resume PDFs keyed by content digest. PDFs
+        # hold personal data, so they are kept in process memory only
+        self._pdf_cache = OrderedDict()
+        self._pdf_cache_lock = threading.Lock()
+        
         self.initialize_client()
         
     def initialize_client(self):
@@ -19,19 +264,81 @@ class PDFCrowdClient:
             return
             
         try:
-            self.client = pdfcrowd.HtmlToPdfClient(self.username, self.api_key)
-            
-            # Set default options
-            self.client.setPageWidth("8.5in")
-            self.client.setPageHeight("11in")
-            self.client.setMarginTop("0.5in")
-            self.client.setMarginBottom("0.5in")
-            self.client.setMarginLeft("0.75in")
-            self.client.setMarginRight("0.75in")
+            self.client = self._create_client()
             
         except Exception as e:
             st.warning(f"PDFCrowd initialization error: {str(e)}")
     
+    def _create_client(self, options=None):
+        """
+        Create a PDFCrowd client with the default page setup
+        
+        Args:
+            options: Dictionary of PDFCrowd options applied after the defaults
+            
+        Returns:
+            HtmlToPdfClient: Configured client
+        """
+        client = pdfcrowd.HtmlToPdfClient(self.username, self.api_key)
+        
+        # Set default options
+        client.setPageWidth("8.5in")
+        client.setPageHeight("11in")
+        client.setMarginTop("0.5in")
+        client.setMarginBottom("0.5in")
+        client.setMarginLeft("0.75in")
+        client.setMarginRight("0.75in")
+        
+        if options:
+            self._apply_options(client, options)
+        
+        return client
+    
+    def _apply_options(self, client, options):
+        """
+        Apply PDFCrowd options to a client
+        
+        Args:
+            client: PDFCrowd client
+            options: Dictionary of PDFCrowd options
+        """
+        for key, value in options.items():
+            # Call the corresponding setter if it exists
+            setter = _OPTION_SETTERS.get(key)
+            if setter is not None:
+                setter(client, value)
+    
+    def _acquire_template_client(self, template_name):
+        """
+        Take an idle client configured for a template from the pool, creating
+        one if none is idle
+        
+        Args:
+            template_name: Name of the template
+            
+        Returns:
+            HtmlToPdfClient: Configured client
+        """
+        with self._pool_lock:
+            idle_clients = self._client_pool.get(template_name)
+            if idle_clients:
+                return idle_clients.pop()
+        
+        return self._create_client(self._get_template_options(template_name))
+    
+    def _release_template_client(self, template_name, client):
+        """
+        Return a client taken with _acquire_template_client to the pool
+        
+        Args:
+            template_name: Name of the template the client is configured for
+            client: PDFCrowd client
+        """
+        with self._pool_lock:
+            idle_clients = self._client_pool.setdefault(template_name, [])
+            if len(idle_clients) < _MAX_IDLE_CLIENTS:
+                idle_clients.append(client)
+    
     def html_to_pdf(self, html_content, output_file=None, options=None):
         """
         Convert HTML content to PDF
@@ -46,7 +353,63 @@ class PDFCrowdClient:
         """
         if not self.initialized or self.client is None:
             return (False, "PDFCrowd client not initialized")
+        
+        # Apply custom options if provided
+        if options:
+            self._apply_options(self.client, options)
+        
+        return self._convert(self.client, html_content, output_file)
+    
+    def html_to_pdf_bytes(self, html_content, options=None):
+        """
+        Convert HTML content to PDF in memory, without writing a file
+        
+        Args:
+            html_content: HTML content to convert
+            options: Dictionary of PDFCrowd options
+            
+        Returns:
+            tuple: (success, PDF bytes or error message)
+        """
+        if not self.initialized or self.client is None:
+            return (False, "PDFCrowd client not initialized")
+        
+        # Apply custom options if provided
+        if options:
+            self._apply_options(self.client, options)
+        
+        return self._convert_bytes(self.client, html_content)
+    
+    def _convert_bytes(self, client, html_content):
+        """
+        Convert HTML content to PDF bytes in memory with the given client
+        
+        Args:
+            client: PDFCrowd client
+            html_content: HTML content to convert
+            
+        Returns:
+            tuple: (success, PDF bytes or error message)
+        """
+        try:
+            return (True, client.convertStream(_compress_html(html_content)))
+            
+        except pdfcrowd.Error as e:
+            st.error(f"PDFCrowd conversion error: {str(e)}")
+            return (False, str(e))
+    
+    def _convert(self, client, html_content, output_file=None):
+        """
+        Convert HTML content to a PDF file with the given client
+        
+        Args:
+            client: PDFCrowd client
+            html_content: HTML content to convert
+            output_file: File path to save PDF (if None, temp file is created)
             
+        Returns:
+            tuple: (success, file_path or error message)
+        """
         # Create a temp file if output_file is not specified
         if output_file is None:
             # Create temp file
@@ -54,19 +417,8 @@ class PDFCrowdClient:
             os.close(fd)
         
         try:
-            # Apply custom options if provided
-            if options:
-                for key, value in options.items():
-                    # Convert option names from snake_case to camelCase method names
-                    option_parts = key.split('_')
-                    method_name = 'set' + ''.join(p.capitalize() for p in option_parts)
-                    
-                    # Call the corresponding method if it exists
-                    if hasattr(self.client, method_name):
-                        getattr(self.client, method_name)(value)
-            
             # Convert HTML to PDF
-            self.client.convertStringToFile(html_content, output_file)
+            client.convertStreamToFile(_compress_html(html_content), output_file)
             
             return (True, output_file)
             
@@ -83,16 +435,67 @@ class PDFCrowdClient:
             template_name: Name of the template to use
             
         Returns:
-            tuple: (success, file_path or error message)
+            tuple: (success, PDF bytes or error message)
         """
+        if not self.initialized or self.client is None:
+            return (False, "PDFCrowd client not initialized")
+        
         # Apply the template to create HTML content
         html_content = self._apply_template(resume_sections, template_name)
         
-        # Set template-specific options
-        options = self._get_template_options(template_name)
+        # Reuse the PDF generated earlier for identical content, e.g. when a
+        # download is clicked again or the script reruns
+        key = self._cache_key(html_content, template_name)
+        pdf_bytes = self._cache_get(key)
+        if pdf_bytes is not None:
+            return (True, pdf_bytes)
         
-        # Convert to PDF
-        return self.html_to_pdf(html_content, options=options)
+        # Convert to PDF in memory with a client already set up for the
+        # template; the bytes can go straight to st.download_button
+        client = self._acquire_template_client(template_name)
+        try:
+            success, result = self._convert_bytes(client, html_content)
+        finally:
+            self._release_template_client(template_name, client)
+        if success:
+            self._cache_put(key, result)
+        return (success, result)
+    
+    def _cache_key(self, html_content, template_name):
+        """
+        Get the key a generated resume PDF is cached under
+        
+        The key covers the rendered HTML rather than just the resume
+        sections, so template changes never serve a stale PDF.
+        
+        Args:
+            html_content: HTML content of the resume
+            template_name: Name of the template used
+            
+        Returns:
+            bytes: Digest identifying the PDF
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(template_name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(html_content.encode("utf-8"))
+        return digest.digest()
+    
+    def _cache_get(self, key):
+        """Return the cached PDF bytes for key, or None on a miss"""
+        with self._pdf_cache_lock:
+            pdf_bytes = self._pdf_cache.get(key)
+            if pdf_bytes is not None:
+                self._pdf_cache.move_to_end(key)
+            return pdf_bytes
+    
+    def _cache_put(self, key, pdf_bytes):
+        """Store PDF bytes for key, evicting the least recently used entry"""
+        with self._pdf_cache_lock:
+            self._pdf_cache[key] = pdf_bytes
+            self._pdf_cache.move_to_end(key)
+            if len(self._pdf_cache) > _PDF_CACHE_SIZE:
+                self._pdf_cache.popitem(last=False)
     
     def _get_template_options(self, template_name):
         """
@@ -104,45 +507,9 @@ class PDFCrowdClient:
         Returns:
             dict: PDFCrowd options
         """
-        # Default options
-        options = {}
-        
-        # Template-specific options
-        if template_name == "modern":
-            options = {
-                "page_width": "8.5in",
-                "page_height": "11in",
-                "margin_top": "0.5in",
-                "margin_bottom": "0.5in",
-                "margin_left": "0.75in",
-                "margin_right": "0.75in",
-                "header_html": "<div></div>",  # Empty header
-                "footer_html": "<div style='text-align: center; font-size: 8pt; color: #666;'>Page <span class='pdfcrowd-page-number'></span> of <span class='pdfcrowd-page-count'></span></div>"
-            }
-        elif template_name == "technical":
-            options = {
-                "page_width": "8.5in",
-                "page_height": "11in",
-                "margin_top": "0.5in",
-                "margin_bottom": "0.5in",
-                "margin_left": "0.75in",
-                "margin_right": "0.75in",
-                "header_html": "<div></div>",  # Empty header
-                "footer_html": "<div style='text-align: center; font-size: 8pt; color: #666;'>Page <span class='pdfcrowd-page-number'></span> of <span class='pdfcrowd-page-count'></span></div>"
-            }
-        elif template_name == "minimalist":
-            options = {
-                "page_width": "8.5in",
-                "page_height": "11in",
-                "margin_top": "0.5in",
-                "margin_bottom": "0.5in",
-                "margin_left": "0.75in",
-                "margin_right": "0.75in",
-                "header_html": "<div></div>",  # Empty header
-                "footer_html": "<div style='text-align: center; font-size: 8pt; color: #666;'>Page <span class='pdfcrowd-page-number'></span> of <span class='pdfcrowd-page-count'></span></div>"
-            }
-        
-        return options
+        # Unknown templates get no options, as they get no template CSS.
+        # Return a copy so callers can't change the shared defaults
+        return dict(_TEMPLATE_OPTIONS) if template_name in _TEMPLATE_CSS else {}
     
     def _apply_template(self, resume_sections, template_name):
         """
@@ -155,152 +522,49 @@ class PDFCrowdClient:
         Returns:
             str: HTML content
         """
-        # Base HTML structure
-        html = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Professional Resume</title>
-            <style>
-                {css}
-            </style>
-        </head>
-        <body>
-            <div class="resume-container">
-                {content}
-            </div>
-        </body>
-        </html>
-        """
-        
         # Get template-specific CSS
         css = self._get_template_css(template_name)
         
-        # Generate the content based on resume sections
-        content = ""
+        # Collect the document fragments and join them once at the end
+        # instead of growing strings with += for every section
+        parts = [_HTML_PRE, css, _HTML_MID, "<div class='resume-header'>"]
         
         # Header section (Contact + Summary)
-        header = ""
         if "Contact" in resume_sections and resume_sections["Contact"] != "Missing":
-            contact_html = f"""
-            <div class="contact-info">
-                {resume_sections["Contact"]}
-            </div>
-            """
-            header += contact_html
+            parts.append('<div class="contact-info">')
+            parts.append(resume_sections["Contact"])
+            parts.append("</div>")
         
         if "Summary" in resume_sections and resume_sections["Summary"] != "Missing":
-            summary_html = f"""
-            <div class="summary-section">
-                <h2>Professional Summary</h2>
-                <div class="section-content">
-                    {resume_sections["Summary"]}
-                </div>
-            </div>
-            """
-            header += summary_html
-        
-        content += f"<div class='resume-header'>{header}</div>"
+            parts.append('<div class="summary-section"><h2>Professional Summary</h2><div class="section-content">')
+            parts.append(resume_sections["Summary"])
+            parts.append("</div></div>")
+        
+        parts.append("</div><div class='resume-body'>")
         
         # Main content sections
-        main_content = ""
-        
-        # Education
-        if "Education" in resume_sections and resume_sections["Education"] != "Missing":
-            education_html = f"""
-            <div class="resume-section">
-                <h2>Education</h2>
-                <div class="section-content">
-                    {resume_sections["Education"]}
-                </div>
-            </div>
-            """
-            main_content += education_html
-        
-        # Work Experience
-        if "Work Experience" in resume_sections and resume_sections["Work Experience"] != "Missing":
-            experience_html = f"""
-            <div class="resume-section">
-                <h2>Work Experience</h2>
-                <div class="section-content">
-                    {resume_sections["Work Experience"]}
-                </div>
-            </div>
-            """
-            main_content += experience_html
-        
-        # Skills
-        if "Skills" in resume_sections and resume_sections["Skills"] != "Missing":
-            skills_html = f"""
-            <div class="resume-section">
-                <h2>Skills</h2>
-                <div class="section-content">
-                    {resume_sections["Skills"]}
-                </div>
-            </div>
-            """
-            main_content += skills_html
-        
-        # Projects
-        if "Projects" in resume_sections and resume_sections["Projects"] != "Missing":
-            projects_html = f"""
-            <div class="resume-section">
-                <h2>Projects</h2>
-                <div class="section-content">
-                    {resume_sections["Projects"]}
-                </div>
-            </div>
-            """
-            main_content += projects_html
-        
-        # Certifications
-        if "Certifications" in resume_sections and resume_sections["Certifications"] != "Missing":
-            certifications_html = f"""
-            <div class="resume-section">
-                <h2>Certifications</h2>
-                <div class="section-content">
-                    {resume_sections["Certifications"]}
-                </div>
-            </div>
-            """
-            main_content += certifications_html
-        
-        # Languages
-        if "Languages" in resume_sections and resume_sections["Languages"] != "Missing":
-            languages_html = f"""
-            <div class="resume-section">
-                <h2>Languages</h2>
-                <div class="section-content">
-                    {resume_sections["Languages"]}
-                </div>
-            </div>
-            """
-            main_content += languages_html
+        for section_name in _SECTION_ORDER:
+            content_text = resume_sections.get(section_name, "Missing")
+            if content_text != "Missing":
+                parts.append('<div class="resume-section"><h2>')
+                parts.append(section_name)
+                parts.append('</h2><div class="section-content">')
+                parts.append(content_text)
+                parts.append("</div></div>")
         
         # Add other sections
         for section_name, content_text in resume_sections.items():
-            if content_text != "Missing" and section_name not in [
-                "Contact", "Summary", "Education", "Work Experience", 
-                "Skills", "Projects", "Certifications", "Languages"
-            ]:
-                section_html = f"""
-                <div class="resume-section">
-                    <h2>{section_name}</h2>
-                    <div class="section-content">
-                        {content_text}
-                    </div>
-                </div>
-                """
-                main_content += section_html
-        
-        content += f"<div class='resume-body'>{main_content}</div>"
-        
-        # Fill in the HTML template
-        html = html.format(css=css, content=content)
-        
-        return html
+            if content_text != "Missing" and section_name not in _KNOWN_SECTIONS:
+                parts.append('<div class="resume-section"><h2>')
+                parts.append(section_name)
+                parts.append('</h2><div class="section-content">')
+                parts.append(content_text)
+                parts.append("</div></div>")
+        
+        parts.append("</div>")
+        parts.append(_HTML_POST)
+        
+        return "".join(parts)
     
     def _get_template_css(self, template_name):
         """
@@ -312,153 +576,7 @@ class PDFCrowdClient:
         Returns:
             str: CSS styles
         """
-        # Base CSS
-        base_css = """
-            * {
-                margin: 0;
-                padding: 0;
-                box-sizing: border-box;
-            }
-            
-            body {
-                font-family: Arial, sans-serif;
-                color: #333;
-                line-height: 1.5;
-            }
-            
-            .resume-container {
-                width: 100%;
-                max-width: 8.5in;
-                margin: 0 auto;
-            }
-            
-            h1, h2, h3 {
-                margin-bottom: 0.5rem;
-            }
-            
-            .resume-section {
-                margin-bottom: 1.25rem;
-            }
-            
-            .section-content {
-                margin-top: 0.3rem;
-            }
-        """
-        
-        # Template-specific CSS
-        if template_name == "modern":
-            template_css = """
-                body {
-                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                    color: #333;
-                }
-                
-                .resume-header {
-                    padding-bottom: 1.5rem;
-                    margin-bottom: 1.5rem;
-                    border-bottom: 2px solid #4361EE;
-                }
-                
-                .contact-info {
-                    font-size: 0.9rem;
-                    color: #555;
-                }
-                
-                h2 {
-                    color: #4361EE;
-                    font-size: 1.3rem;
-                    border-bottom: 1px solid #ddd;
-                    padding-bottom: 0.3rem;
-                }
-                
-                .summary-section {
-                    margin-top: 1rem;
-                }
-            """
-        elif template_name == "technical":
-            template_css = """
-                body {
-                    font-family: 'Courier New', monospace;
-                    color: #2c3e50;
-                }
-                
-                .resume-header {
-                    padding-bottom: 1.5rem;
-                    margin-bottom: 1.5rem;
-                    border-bottom: 2px solid #3498db;
-                }
-                
-                .contact-info {
-                    font-size: 0.9rem;
-                    color: #555;
-                }
-                
-                h2 {
-                    color: #3498db;
-                    font-size: 1.3rem;
-                    border-bottom: 1px solid #ddd;
-                    padding-bottom: 0.3rem;
-                }
-                
-                .summary-section {
-                    margin-top: 1rem;
-                }
-                
-                /* Technical template has a side column for skills */
-                @media print {
-                    .resume-body {
-                        display: grid;
-                        grid-template-columns: 70% 30%;
-                        grid-gap: 1.5rem;
-                    }
-                    
-                    .skills-section {
-                        grid-column: 2;
-                        grid-row: 1 / span 3;
-                        background-color: #f8f9fa;
-                        padding: 1rem;
-                        border-radius: 5px;
-                    }
-                }
-            """
-        elif template_name == "minimalist":
-            template_css = """
-                body {
-                    font-family: Arial, sans-serif;
-                    color: #555;
-                    line-height: 1.8;
-                }
-                
-                .resume-header {
-                    padding-bottom: 1rem;
-                    margin-bottom: 1rem;
-                    text-align: center;
-                }
-                
-                .contact-info {
-                    font-size: 0.9rem;
-                    text-align: center;
-                }
-                
-                h2 {
-                    color: #333;
-                    font-size: 1.2rem;
-                    text-transform: uppercase;
-                    letter-spacing: 1px;
-                    margin-top: 1.5rem;
-                }
-                
-                .summary-section {
-                    margin-top: 1rem;
-                    text-align: center;
-                    font-style: italic;
-                }
-            """
-        else:
-            # Default CSS
-            template_css = ""
-        
-        return base_css + template_css
+        return _TEMPLATE_CSS.get(template_name, _BASE_CSS)
 
 # Initialize PDFCrowd client
 pdfcrowd_client = PDFCrowdClient() 
\ No newline at end of file
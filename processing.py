@@ -7,8 +7,16 @@ def calculate_scores(resume_data: dict) -> dict:
         "missing_sections": list
     }
     """
-    # Implementation using HuggingFace transformers
-    from transformers import pipeline
-    analyzer = pipeline('text-classification', model='distilbert-base-uncased')
+    # Nothing to score
+    if not resume_data or all(text in (None, "", "Missing") for text in resume_data.values()):
+        return {
+            "gen_ai_score": 0,
+            "ai_score": 0,
+            "grammar_errors": [],
+            "missing_sections": list(resume_data or ())
+        }
     
-    # ... existing scoring logic with added input validation ...
\ No newline at end of file
+    # Scoring needs a classifier fine-tuned to tell AI-generated text from
+    # human writing; distilbert-base-uncased only has an untrained
+    # classification head, so its outputs cannot be reported as scores
+    raise NotImplementedError("calculate_scores needs a fine-tuned text classifier")
\ No newline at end of file
@@ -1,10 +1,28 @@
 import pusher
+import itertools
 import json
+import logging
+import os
 import time
 import uuid
 import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from utils.api_config import API_CONFIG
 
+logger = logging.getLogger(__name__)
+
+# Maximum number of events Pusher accepts in one batch request
+_MAX_BATCH_EVENTS = 10
+
+# Event IDs are a random per-process prefix plus a counter: unique across
+# processes and hosts without reading fresh randomness for every event
+_EVENT_ID_PREFIX = uuid.uuid4().hex[:16]
+_EVENT_COUNTER = itertools.count()
+
+# Delay added to simulated events when PUSHER_SIMULATE_LATENCY is set
+_SIMULATED_LATENCY = 0.2
+
 class PusherClient:
     def __init__(self):
         self.config = API_CONFIG["pusher"]
@@ -14,13 +32,37 @@ class PusherClient:
         self.cluster = self.config["cluster"]
         self.initialized = all([self.app_id, self.key, self.secret, self.cluster])
         self.client = None
+        self._client_js = None
         self.initialize_client()
         
     def initialize_client(self):
         """Initialize Pusher client with API credentials"""
         if not self.initialized:
             return
+        
+        # The frontend code only depends on the key and cluster, so build
+        # it once rather than on every page render
+        self._client_js = f"""
+        <script src="https://js.pusher.com/7.0/pusher.min.js"></script>
+        <script>
+            // Initialize Pusher
+            const pusher = new Pusher('{self.key}', {{
+                cluster: '{self.cluster}',
+                encrypted: true
+            }});
+            
+            // Function to subscribe to a channel
+            function subscribeToChannel(channelName, eventName, callback) {{
+                const channel = pusher.subscribe(channelName);
+                channel.bind(eventName, callback);
+                return channel;
+            }}
             
+            // For debug purposes
+            window.pusherClient = pusher;
+        </script>
+        """
+        
         try:
             self.client = pusher.Pusher(
                 app_id=self.app_id,
@@ -30,6 +72,17 @@ class PusherClient:
                 ssl=True
             )
             
+            # The requests backend sends every event through one session;
+            # give it a pool sized for bursts of events so connections are
+            # kept alive and reused, and retry failed connection attempts
+            session = getattr(getattr(self.client._pusher_client, "http", None), "session", None)
+            if session is not None:
+                session.mount("https://", HTTPAdapter(
+                    pool_connections=10,
+                    pool_maxsize=20,
+                    max_retries=Retry(total=2, backoff_factor=0.1)
+                ))
+            
         except Exception as e:
             st.warning(f"Pusher initialization error: {str(e)}")
     
@@ -50,21 +103,64 @@ class PusherClient:
             return self._simulate_event(channel, event, data)
             
         try:
-            # Add timestamp and event ID
-            enhanced_data = {
-                **data,
-                "timestamp": int(time.time()),
-                "event_id": str(uuid.uuid4())
-            }
-            
             # Trigger the event
-            self.client.trigger(channel, event, enhanced_data)
+            self.client.trigger(channel, event, self._event_data(data))
+            return True
+            
+        except Exception as e:
+            st.warning(f"Pusher event error: {str(e)}")
+            return False
+    
+    def trigger_events(self, events, copy_data=True):
+        """
+        Trigger several Pusher events, sending up to ten per HTTP request
+        
+        Args:
+            events: (channel, event, data) tuples
+            copy_data: Whether to copy each event's data before adding the
+                       timestamp and event ID; pass False for data dicts
+                       used by no other event, to add them in place
+            
+        Returns:
+            bool: True if successful
+        """
+        if not self.initialized or self.client is None:
+            # Simulate events for demo purposes
+            return all([self._simulate_event(channel, event, data) for channel, event, data in events])
+            
+        try:
+            batch = [
+                {"channel": channel, "name": event, "data": self._event_data(data, copy_data)}
+                for channel, event, data in events
+            ]
+            
+            # Trigger the events in as few batch requests as possible
+            for start in range(0, len(batch), _MAX_BATCH_EVENTS):
+                self.client.trigger_batch(batch[start:start + _MAX_BATCH_EVENTS])
             return True
             
         except Exception as e:
             st.warning(f"Pusher event error: {str(e)}")
             return False
     
+    def _event_data(self, data, copy_data=True):
+        """
+        Add a timestamp and event ID to event data
+        
+        Args:
+            data: Event data
+            copy_data: Whether to add them to a copy rather than to data itself
+            
+        Returns:
+            dict: Event data to send
+        """
+        if copy_data:
+            data = dict(data)
+        
+        data["timestamp"] = int(time.time())
+        data["event_id"] = f"{_EVENT_ID_PREFIX}-{next(_EVENT_COUNTER):x}"
+        return data
+    
     def _simulate_event(self, channel, event, data):
         """
         Simulate a Pusher event for demo purposes
@@ -77,11 +173,14 @@ class PusherClient:
         Returns:
             bool: Always True
         """
-        # Log the event to console
-        print(f"[SIMULATED PUSHER EVENT] Channel: {channel}, Event: {event}, Data: {json.dumps(data)}")
+        # Log the event, serializing the data only when debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SIMULATED PUSHER EVENT] Channel: %s, Event: %s, Data: %s",
+                         channel, event, json.dumps(data))
         
-        # Add a small delay to simulate network latency
-        time.sleep(0.2)
+        # Optionally add a small delay to simulate network latency
+        if os.environ.get("PUSHER_SIMULATE_LATENCY"):
+            time.sleep(_SIMULATED_LATENCY)
         
         return True
     
@@ -95,28 +194,7 @@ class PusherClient:
         if not self.initialized:
             return "console.warn('Pusher not configured');"
             
-        js_code = f"""
-        <script src="https://js.pusher.com/7.0/pusher.min.js"></script>
-        <script>
-            // Initialize Pusher
-            const pusher = new Pusher('{self.key}', {{
-                cluster: '{self.cluster}',
-                encrypted: true
-            }});
-            
-            // Function to subscribe to a channel
-            function subscribeToChannel(channelName, eventName, callback) {{
-                const channel = pusher.subscribe(channelName);
-                channel.bind(eventName, callback);
-                return channel;
-            }}
-            
-            // For debug purposes
-            window.pusherClient = pusher;
-        </script>
-        """
-        
-        return js_code
+        return self._client_js
     
     def get_user_channel(self, user_id):
         """
@@ -161,19 +239,19 @@ class PusherClient:
         # Resume channel for resume-specific updates
         resume_channel = self.get_resume_channel(resume_id)
         
-        # Trigger event on both channels
-        user_result = self.trigger_event(user_channel, f"resume_{update_type}", {
-            "resume_id": resume_id,
-            "update_type": update_type,
-            "data": data
-        })
-        
-        resume_result = self.trigger_event(resume_channel, f"update_{update_type}", {
-            "update_type": update_type,
-            "data": data
-        })
-        
-        return user_result and resume_result
+        # Trigger event on both channels in one request; the event dicts
+        # are built here, so the metadata can be added to them in place
+        return self.trigger_events([
+            (user_channel, f"resume_{update_type}", {
+                "resume_id": resume_id,
+                "update_type": update_type,
+                "data": data
+            }),
+            (resume_channel, f"update_{update_type}", {
+                "update_type": update_type,
+                "data": data
+            })
+        ], copy_data=False)
     
     def trigger_job_match_update(self, user_id, resume_id, job_id, update_type, data):
         """
@@ -195,20 +273,20 @@ class PusherClient:
         # Job match channel
         job_match_channel = f"private-job-match-{resume_id}-{job_id}"
         
-        # Trigger event on both channels
-        user_result = self.trigger_event(user_channel, f"job_match_{update_type}", {
-            "resume_id": resume_id,
-            "job_id": job_id,
-            "update_type": update_type,
-            "data": data
-        })
-        
-        match_result = self.trigger_event(job_match_channel, f"update_{update_type}", {
-            "update_type": update_type,
-            "data": data
-        })
-        
-        return user_result and match_result
+        # Trigger event on both channels in one request; the event dicts
+        # are built here, so the metadata can be added to them in place
+        return self.trigger_events([
+            (user_channel, f"job_match_{update_type}", {
+                "resume_id": resume_id,
+                "job_id": job_id,
+                "update_type": update_type,
+                "data": data
+            }),
+            (job_match_channel, f"update_{update_type}", {
+                "update_type": update_type,
+                "data": data
+            })
+        ], copy_data=False)
 
 # Initialize Pusher client
 pusher_client = PusherClient() 
\ No newline at end of file
@@ -3,17 +3,10 @@ Resume AI - All-in-one application
 """
 import streamlit as st
 import os
-import sys
-import time
 import re
 import logging
-import math
-import tempfile
-import traceback
-from pathlib import Path
-from datetime import datetime
-from collections import Counter
-from typing import Dict, List, Set, Tuple, Any, Optional
+import importlib
+from functools import lru_cache
 
 # Set page configuration as the first Streamlit command for optimal loading
 st.set_page_config(
@@ -31,9 +24,8 @@ logger = logging.getLogger(__name__)
 # Custom CSS and UI Components
 #####################################################################
 
-def load_css():
-    """Load custom CSS for styling the app"""
-    return """
+# Custom CSS, built once at import rather than on every rerun
+_CSS = """
     <style>
     /* General styling */
     body {
@@ -144,9 +136,20 @@ def load_css():
     </style>
     """
 
-def render_feature_card(title, description, icon, button_text="Get Started", on_click=None):
-    """Render a feature card with consistent styling"""
-    st.markdown(f"""
+# The stylesheet is inlined into the page on every rerun, so strip comments
+# and whitespace once at import rather than sending them each time
+_CSS_MIN = re.sub(r"/\*.*?\*/", "", _CSS, flags=re.S)
+_CSS_MIN = re.sub(r"\s+", " ", _CSS_MIN)
+_CSS_MIN = re.sub(r"\s*([{};:,])\s*", r"\1", _CSS_MIN).strip()
+
+def load_css():
+    """Load custom CSS for styling the app"""
+    return _CSS_MIN
+
+@lru_cache(maxsize=32)
+def _feature_card_html(title, description, icon):
+    """Build the HTML for a feature card; the cards are static, so each is built once"""
+    return f"""
     <div class="card">
         <div style="display: flex; align-items: center; margin-bottom: 1rem;">
             <div style="background-color: rgba(67, 97, 238, 0.1); border-radius: 12px; width: 42px; height: 42px; 
@@ -157,7 +160,11 @@ def render_feature_card(title, description, icon, button_text="Get Started", on_
         </div>
         <p style="color: #64748B; margin-bottom: 1.5rem; font-size: 0.95rem;">{description}</p>
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+def render_feature_card(title, description, icon, button_text="Get Started", on_click=None):
+    """Render a feature card with consistent styling"""
+    st.markdown(_feature_card_html(title, description, icon), unsafe_allow_html=True)
     
     if button_text:
         if on_click:
@@ -165,6 +172,28 @@ def render_feature_card(title, description, icon, button_text="Get Started", on_
         else:
             st.button(button_text, key=f"btn_{title.replace(' ', '_').lower()}")
 
+# Step indicator markup for completed, current and future steps
+_STEP_HTML = (
+    """
+                <div style='text-align: center; color: #4CAF50;'>
+                    <div style='font-size: 1.5rem; margin-bottom: 5px;'>✅</div>
+                    <div style='font-size: 0.8rem;'>{name}</div>
+                </div>
+                """,
+    """
+                <div style='text-align: center; color: #2196F3;'>
+                    <div style='font-size: 1.5rem; margin-bottom: 5px;'>{icon}</div>
+                    <div style='font-size: 0.8rem; font-weight: bold;'>{name}</div>
+                </div>
+                """,
+    """
+                <div style='text-align: center; color: #9E9E9E;'>
+                    <div style='font-size: 1.5rem; margin-bottom: 5px;'>{icon}</div>
+                    <div style='font-size: 0.8rem;'>{name}</div>
+                </div>
+                """
+)
+
 def render_step_indicator(steps, current_step=0):
     """
     Render a step indicator for a multi-step process
@@ -178,30 +207,9 @@ def render_step_indicator(steps, current_step=0):
     
     for i, (step_name, step_icon) in enumerate(steps):
         with cols[i]:
-            if i < current_step:
-                # Completed step
-                st.markdown(f"""
-                <div style='text-align: center; color: #4CAF50;'>
-                    <div style='font-size: 1.5rem; margin-bottom: 5px;'>✅</div>
-                    <div style='font-size: 0.8rem;'>{step_name}</div>
-                </div>
-                """, unsafe_allow_html=True)
-            elif i == current_step:
-                # Current step
-                st.markdown(f"""
-                <div style='text-align: center; color: #2196F3;'>
-                    <div style='font-size: 1.5rem; margin-bottom: 5px;'>{step_icon}</div>
-                    <div style='font-size: 0.8rem; font-weight: bold;'>{step_name}</div>
-                </div>
-                """, unsafe_allow_html=True)
-            else:
-                # Future step
-                st.markdown(f"""
-                <div style='text-align: center; color: #9E9E9E;'>
-                    <div style='font-size: 1.5rem; margin-bottom: 5px;'>{step_icon}</div>
-                    <div style='font-size: 0.8rem;'>{step_name}</div>
-                </div>
-                """, unsafe_allow_html=True)
+            # Completed, current or future step
+            step_html = _STEP_HTML[(i > current_step) - (i < current_step) + 1]
+            st.markdown(step_html.format(name=step_name, icon=step_icon), unsafe_allow_html=True)
     
     # Add a separator
     st.markdown("<hr>", unsafe_allow_html=True)
@@ -253,19 +261,17 @@ def render_card(title, content, icon=None, is_expanded=False):
 
 def initialize_session():
     """Initialize basic session state variables"""
-    if "authenticated" not in st.session_state:
-        st.session_state.authenticated = False
-    
-    if "user_id" not in st.session_state:
-        st.session_state.user_id = None
-    
-    if "user_name" not in st.session_state:
-        st.session_state.user_name = None
-        
-    if "page" not in st.session_state:
-        st.session_state.page = "home"
+    st.session_state.setdefault("authenticated", False)
+    st.session_state.setdefault("user_id", None)
+    st.session_state.setdefault("user_name", None)
+    st.session_state.setdefault("page", "home")
         
     # Create necessary directories if they don't exist
+    _ensure_dirs()
+
+@st.cache_resource
+def _ensure_dirs():
+    """Create the app's working directories, once per process"""
     os.makedirs("data", exist_ok=True)
     os.makedirs("templates", exist_ok=True)
     os.makedirs("images", exist_ok=True)
@@ -368,35 +374,22 @@ def main():
             st.markdown(f"👤 **{st.session_state.get('user_name', 'User')}**")
             st.markdown("---")
             
-            # Navigation buttons
-            if st.button("🏠 Home", use_container_width=True):
-                st.session_state.page = "home"
-                st.rerun()
-            
-            if st.button("📝 Resume Enhancer", use_container_width=True):
-                st.session_state.page = "resume_enhancer"
-                st.rerun()
-            
-            if st.button("🎯 Job Matching", use_container_width=True):
-                st.session_state.page = "job_matching"
-                st.rerun()
+            # Navigation buttons; the callbacks update the state before
+            # the rerun the click triggers, so no extra st.rerun is needed
+            st.button("🏠 Home", on_click=set_page, args=("home",), use_container_width=True)
+            st.button("📝 Resume Enhancer", on_click=set_page, args=("resume_enhancer",), use_container_width=True)
+            st.button("🎯 Job Matching", on_click=set_page, args=("job_matching",), use_container_width=True)
             
             st.markdown("---")
             
             # Logout button
-            if st.button("🚪 Logout", use_container_width=True):
-                logout()
-                st.rerun()
+            st.button("🚪 Logout", on_click=logout, use_container_width=True)
         else:
             # User is not logged in, show auth options
             if st.session_state.get("auth_page", "login") == "login":
-                if st.button("Create Account", use_container_width=True):
-                    st.session_state.auth_page = "signup"
-                    st.rerun()
+                st.button("Create Account", on_click=set_auth_page, args=("signup",), use_container_width=True)
             else:
-                if st.button("Login", use_container_width=True):
-                    st.session_state.auth_page = "login"
-                    st.rerun()
+                st.button("Login", on_click=set_auth_page, args=("login",), use_container_width=True)
         
         # App info
         st.markdown("### About")
@@ -419,10 +412,39 @@ def main():
         # User is authenticated, show the requested page
         if st.session_state.page == "home":
             show_home_page()
-        elif st.session_state.page == "resume_enhancer":
-            resume_enhancer_main()
-        elif st.session_state.page == "job_matching":
-            resume_job_matching_main()
+        elif st.session_state.page in _PAGE_MODULES:
+            # Page modules are heavy; import each only when its page is shown
+            page_main = _load_page_main(st.session_state.page)
+            if page_main is None:
+                st.error("This page could not be loaded. Please try again later.")
+            else:
+                page_main()
+
+# Modules providing each page's main(), in order of preference; the
+# underscore files are the actual implementations
+_PAGE_MODULES = {
+    "resume_enhancer": (
+        "pages._resume_enhancer", "pages.resume_enhancer",
+        "_resume_enhancer", "resume_enhancer"
+    ),
+    "job_matching": (
+        "pages._resume_job_matching", "pages._resume_job_matching_fixed",
+        "_resume_job_matching", "_resume_job_matching_fixed"
+    )
+}
+
+def _load_page_main(page):
+    """Import the module for a page and return its main(), or None if none loads"""
+    for module_name in _PAGE_MODULES[page]:
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            continue
+        page_main = getattr(module, "main", None)
+        if page_main is not None:
+            return page_main
+    logger.error(f"Could not load {page} module from any source")
+    return None
 
 def get_feature_data():
     """Return feature data for the home page"""
@@ -460,16 +482,28 @@ def show_home_page():
     st.markdown("<h2>Features</h2>", unsafe_allow_html=True)
     features = get_feature_data()
     
-    # Display features in columns
+    # Display all feature cards in one grid; the cards are stripped so no
+    # blank line ends the HTML block early
+    cards_html = "".join(
+        _feature_card_html(feature["title"], feature["description"], feature["icon"]).strip()
+        for feature in features
+    )
+    st.markdown(
+        f"<div style='display: grid; grid-template-columns: repeat({len(features)}, 1fr); gap: 1rem;'>"
+        f"{cards_html}</div>",
+        unsafe_allow_html=True
+    )
+    
+    # Buttons must stay widgets, so they go in matching columns below the cards
     cols = st.columns(len(features))
     
     for i, feature in enumerate(features):
         with cols[i]:
-            render_feature_card(
-                title=feature["title"],
-                description=feature["description"],
-                icon=feature["icon"],
-                on_click=lambda p=feature["page"]: set_page(p)
+            st.button(
+                "Get Started",
+                key=f"btn_{feature['title'].replace(' ', '_').lower()}",
+                on_click=set_page,
+                args=(feature["page"],)
             )
     
     # Testimonials section
@@ -496,9 +530,12 @@ def show_home_page():
     """, unsafe_allow_html=True)
 
 def set_page(page_name):
-    """Set the current page in session state and trigger a rerun"""
+    """Set the current page in session state (used as a button callback)"""
     st.session_state.page = page_name
-    st.rerun()
+
+def set_auth_page(auth_page):
+    """Switch between the login and signup pages (used as a button callback)"""
+    st.session_state.auth_page = auth_page
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+"""Regression tests for job matching skill detection"""
+
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from job_matching import _count_found_skills, get_matching_score_details
+
+
+def test_punctuated_skills_need_their_punctuation():
+    """A bare "c" or "net" must not count as c++, c# or .net"""
+    assert _count_found_skills(["c++", "c#", ".net"], "I know c, c and net") == 0
+    details = get_matching_score_details("I know c and java", "Skills: c++, java.")
+    assert details["skills_match"] == 50
+
+
+def test_punctuated_skills_are_found():
+    """Punctuated skills still match, ignoring case"""
+    assert _count_found_skills(["c++", "c#", ".net"], "Built services in C++, C# and .NET.") == 3
+
+
+def test_plain_skills_match_whole_words():
+    """Plain skills match whole words only, multi-word skills across punctuation"""
+    assert _count_found_skills(["java"], "Wrote JavaScript") == 0
+    assert _count_found_skills(["java", "machine learning"], "Java, machine-learning") == 2
+
+
+if __name__ == "__main__":
+    print("Testing job matching...")
+    test_punctuated_skills_need_their_punctuation()
+    test_punctuated_skills_are_found()
+    test_plain_skills_match_whole_words()
+    print("Testing complete")